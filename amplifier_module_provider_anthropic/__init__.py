@@ -10,6 +10,7 @@ __all__ = ["mount", "AnthropicProvider"]
 __amplifier_module_type__ = "provider"
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -19,11 +20,14 @@ import uuid
 from decimal import Decimal
 from pathlib import Path
 from threading import Lock
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Sequence
+from typing import Any, ClassVar
 
 from dataclasses import dataclass
 from dataclasses import field
 
+import httpx
 from amplifier_core import ConfigField
 from amplifier_core import ModelInfo
 from amplifier_core import ModuleCoordinator
@@ -49,11 +53,17 @@ from amplifier_core.utils.retry import RetryConfig, retry_with_backoff
 from amplifier_core.message_models import ChatRequest
 from amplifier_core.message_models import ChatResponse
 from amplifier_core.message_models import Message
+from amplifier_core.message_models import TextBlock
+from amplifier_core.message_models import ThinkingBlock
 from amplifier_core.message_models import ToolCall
+from amplifier_core.message_models import ToolCallBlock
+from amplifier_core.message_models import Usage
 from anthropic import APIStatusError as AnthropicAPIStatusError
+from anthropic import APITimeoutError as AnthropicAPITimeoutError
 from anthropic import AsyncAnthropic
 from anthropic import AuthenticationError as AnthropicAuthenticationError
 from anthropic import BadRequestError as AnthropicBadRequestError
+from anthropic import DefaultAsyncHttpxClient
 from anthropic import RateLimitError as AnthropicRateLimitError
 from anthropic._exceptions import (
     OverloadedError as AnthropicOverloadedError,
@@ -231,11 +241,76 @@ async def _get_process_semaphore(max_concurrent: int) -> asyncio.Semaphore | Non
     return _process_semaphore
 
 
+# ---------------------------------------------------------------------------
+# Process-wide HTTP connection pool
+# ---------------------------------------------------------------------------
+# Every AnthropicProvider instance on the same event loop (parent + delegated
+# child sessions) shares one httpx client, so keep-alive connections and TLS
+# sessions are reused instead of each instance opening its own pool. httpx
+# connections are bound to the loop that opened them, so pools are keyed by
+# loop, and reference-counted so the last provider to close tears it down.
+
+
+@dataclass
+class _SharedHttpPool:
+    """A loop-bound httpx client plus the number of providers using it."""
+
+    client: httpx.AsyncClient
+    refs: int = 0
+
+
+_http_pools: dict[Any, _SharedHttpPool] = {}  # keyed by asyncio event loop
+
+
+def _acquire_shared_http_client(pool_size: int) -> tuple[Any, httpx.AsyncClient] | None:
+    """Take a reference on the current loop's shared httpx client.
+
+    Returns ``(loop, client)``, or ``None`` when called outside a running event
+    loop (the caller then uses a private ``DefaultAsyncHttpxClient``). The pool
+    size of the first caller on a loop wins.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    # A pool whose loop has closed cannot be aclose()d (its sockets belong
+    # to that loop). Just discard it: the pool client is a plain httpx
+    # client with no finalizer, so nothing schedules aclose() on this loop,
+    # and its sockets are closed synchronously as the transports are freed.
+    for stale_loop in [key for key in _http_pools if key.is_closed()]:
+        _http_pools.pop(stale_loop, None)
+
+    pool = _http_pools.get(loop)
+    if pool is None or pool.client.is_closed:
+        limits = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=60.0,
+        )
+        pool = _SharedHttpPool(client=DefaultAsyncHttpxClient(limits=limits))
+        _http_pools[loop] = pool
+    pool.refs += 1
+    return loop, pool.client
+
+
+async def _release_shared_http_client(loop: Any, client: httpx.AsyncClient) -> None:
+    """Drop a reference taken by _acquire_shared_http_client()."""
+    pool = _http_pools.get(loop)
+    if pool is None or pool.client is not client:
+        return  # Pool already replaced or torn down
+    pool.refs -= 1
+    if pool.refs <= 0:
+        _http_pools.pop(loop, None)
+        await pool.client.aclose()
+
+
 # Beta header constants — single source of truth for experimental feature headers
 BETA_HEADER_1M_CONTEXT = "context-1m-2025-08-07"
 BETA_HEADER_INTERLEAVED_THINKING = "interleaved-thinking-2025-05-14"
 BETA_HEADER_TASK_BUDGETS = "task-budgets-2026-03-13"
 BETA_HEADER_FAST_MODE = "fast-mode-2026-02-01"
+# Anthropic rejects requests carrying more than four cache_control breakpoints.
+_MAX_CACHE_BREAKPOINTS = 4
 _CLAUDE_CODE_TOOL_NAMES = {
     name.lower(): name
     for name in (
@@ -260,6 +335,13 @@ _CLAUDE_CODE_TOOL_NAMES = {
 }
 PROVIDER_FALLBACK_OPEN = "provider:fallback_open"
 PROVIDER_FALLBACK_ACTIVE = "provider:fallback_active"
+PROVIDER_RESPONSE_CACHE_HIT = "provider:response_cache_hit"
+# Distinct tool lists whose converted form is kept (see _convert_tools_from_request)
+_TOOLS_CACHE_SIZE = 8
+# Content block types checked by _validate_anthropic_tool_consistency
+# (tool_call is the kernel's name for tool_use, kept by _convert_messages)
+_TOOL_USE_BLOCK_TYPES = frozenset({"tool_use", "tool_call"})
+_TOOL_BLOCK_TYPES = _TOOL_USE_BLOCK_TYPES | {"tool_result"}
 FALLBACK_STATE_VERSION = 1
 
 # ---------------------------------------------------------------------------
@@ -333,6 +415,32 @@ class _RuntimeModelInfo:
     supports_adaptive_thinking: bool | None = None
 
 
+@dataclass
+class _RequestParams:
+    """messages.create params plus the facts reported on llm:request."""
+
+    params: dict[str, Any]
+    has_system: bool
+    thinking_enabled: bool
+    thinking_budget: int | None
+    interleaved_thinking: bool
+
+
+@dataclass
+class _ResponseParts:
+    """Accumulators filled per content block by _convert_to_chat_response."""
+
+    content: list[Any] = field(default_factory=list)
+    tool_calls: list[ToolCall] = field(default_factory=list)
+    events: list[TextContent | ThinkingContent | ToolCallContent | WebSearchContent] = (
+        field(default_factory=list)
+    )
+    text: list[str] = field(default_factory=list)
+    web_search_results: list[dict[str, Any]] = field(default_factory=list)
+    # OAuth canonical tool name (lowercased) -> caller's tool name
+    tool_names: dict[str, str] = field(default_factory=dict)
+
+
 @dataclass
 class _FallbackWindow:
     """Temporary downgrade window for a model family."""
@@ -381,6 +489,10 @@ def _clear_fallback_windows() -> None:
         _fallback_windows.clear()
 
 
+# Sentinel queued by stream_complete() once the underlying request finishes.
+_STREAM_DONE = object()
+
+
 class AnthropicChatResponse(ChatResponse):
     """ChatResponse with additional fields for streaming UI compatibility."""
 
@@ -545,6 +657,8 @@ class AnthropicProvider:
             AnthropicAuth(api_key, oauth=False) if api_key else None
         )
         self._client: AsyncAnthropic | None = None  # Lazy init
+        # Reference on the process-wide httpx pool backing self._client, if any.
+        self._http_pool_lease: tuple[Any, httpx.AsyncClient] | None = None
         self.coordinator = coordinator
         self.default_model = self.config.get("default_model", "claude-sonnet-4-5")
         self._default_caps = self._get_capabilities(self.default_model)
@@ -637,6 +751,27 @@ class AnthropicProvider:
         self._max_concurrent_requests = int(
             self.config.get("max_concurrent_requests", 5)
         )
+        # Fire-and-forget hook emissions still in flight (see _emit_nowait).
+        self._pending_hook_tasks: set[asyncio.Task] = set()
+        # Connection limits for the shared httpx pool (see _http_pools).
+        self._pool_size = max(
+            1, self._config_int(self.config.get("pool_size", 100), 100)
+        )
+
+        # Opt-in LRU cache of deterministic (temperature=0) responses, keyed by
+        # a hash of the final request params. Off by default: callers that
+        # retry identical prompts expecting a fresh answer would be surprised.
+        self._response_cache_enabled = self._config_bool(
+            self.config.get("response_cache", False)
+        )
+        self._response_cache_size = max(
+            1, self._config_int(self.config.get("response_cache_size", 256), 256)
+        )
+        self._response_cache: OrderedDict[str, ChatResponse] = OrderedDict()
+        # Converted tool definitions keyed by tool-object identity.
+        self._tools_cache: OrderedDict[
+            tuple[int, ...], tuple[tuple[Any, ...], list[dict[str, Any]]]
+        ] = OrderedDict()
 
         # Use streaming API by default to support large context windows (Anthropic requires streaming
         # for operations that may take > 10 minutes, e.g. with 300k+ token contexts)
@@ -729,6 +864,17 @@ class AnthropicProvider:
         if self._client is None:
             if self._api_key is None:
                 raise ValueError("api_key must be provided for API calls")
+            # Share the process-wide connection pool when created inside a
+            # running loop; otherwise use a private httpx client. Either way
+            # the SDK never builds its own: that wrapper's __del__ schedules
+            # aclose() on whichever loop runs at GC time, which fails once
+            # the loop that opened its connections has closed.
+            self._http_pool_lease = _acquire_shared_http_client(self._pool_size)
+            http_client = (
+                self._http_pool_lease[1]
+                if self._http_pool_lease
+                else DefaultAsyncHttpxClient()
+            )
             # Set SDK max_retries=0 - we handle retries ourselves to properly
             # honor retry-after headers with jitter and longer backoffs
             auth = self._auth_state
@@ -743,6 +889,8 @@ class AnthropicProvider:
                     base_url=self._base_url,
                     default_headers=self._default_headers,
                     max_retries=0,
+                    timeout=self.timeout,
+                    http_client=http_client,
                 )
                 self._client.api_key = None
             else:
@@ -751,9 +899,23 @@ class AnthropicProvider:
                     base_url=self._base_url,
                     default_headers=self._default_headers,
                     max_retries=0,
+                    timeout=self.timeout,
+                    http_client=http_client,
                 )
         return self._client
 
+    async def _close_client(self, client: AsyncAnthropic) -> None:
+        """Close an SDK client, releasing (not closing) a shared httpx pool."""
+        http_client = getattr(client, "_client", None)
+        lease = self._http_pool_lease
+        if lease is not None and http_client is lease[1]:
+            self._http_pool_lease = None
+            await _release_shared_http_client(*lease)
+            return
+        if any(pool.client is http_client for pool in _http_pools.values()):
+            return  # Reference already released; other providers own the pool
+        await client.close()
+
     async def _refresh_auth(self) -> None:
         """Refresh OAuth credentials and rotate the SDK client when needed."""
         if self._auth_manager is None:
@@ -774,7 +936,7 @@ class AnthropicProvider:
                 "anthropic-beta": ",".join(self._beta_headers),
             }
         if old_client is not None:
-            await old_client.close()
+            await self._close_client(old_client)
 
     def get_info(self) -> ProviderInfo:
         """Get provider metadata."""
@@ -1406,6 +1568,150 @@ class AnthropicProvider:
         )
         return any(marker in text for marker in cf_markers)
 
+    def _translate_api_error(
+        self, e: BaseException, *, model: str | None, timeout: float | None = None
+    ) -> KernelLLMError:
+        """Translate an SDK (or transport) exception into a kernel LLMError.
+
+        Args:
+            e: Exception raised by an Anthropic SDK call
+            model: Model to report on the error
+            timeout: Timeout in effect, reported on timeout errors
+
+        Returns:
+            The kernel error for the caller to raise ``from e``.
+        """
+        if isinstance(e, KernelLLMError):
+            return e
+
+        body = getattr(e, "body", None)
+        error_msg = json.dumps(body) if body is not None else str(e)
+
+        if isinstance(e, AnthropicRateLimitError):
+            rate_info = self._parse_rate_limit_info(e)
+            return KernelRateLimitError(
+                error_msg,
+                provider="anthropic",
+                model=model,
+                status_code=429,
+                retryable=True,
+                retry_after=rate_info.get("retry_after_seconds"),
+            )
+
+        if isinstance(e, AnthropicAuthenticationError):
+            return KernelAuthenticationError(
+                error_msg,
+                provider="anthropic",
+                model=model,
+                status_code=getattr(e, "status_code", 401),
+            )
+
+        if isinstance(e, AnthropicBadRequestError):
+            raw_msg = str(e).lower()
+            if "context length" in raw_msg or "too many tokens" in raw_msg:
+                error_cls = KernelContextLengthError
+            elif (
+                "content filter" in raw_msg
+                or "safety" in raw_msg
+                or "blocked" in raw_msg
+            ):
+                error_cls = KernelContentFilterError
+            else:
+                error_cls = KernelInvalidRequestError
+            return error_cls(
+                error_msg,
+                provider="anthropic",
+                model=model,
+                status_code=getattr(e, "status_code", 400),
+            )
+
+        if isinstance(e, AnthropicOverloadedError):
+            retry_after: float | None = None
+            if hasattr(e, "response") and e.response:
+                raw = e.response.headers.get("retry-after")
+                if raw is not None:
+                    try:
+                        retry_after = float(raw)
+                    except (ValueError, TypeError):
+                        pass
+            return KernelProviderUnavailableError(
+                error_msg,
+                provider="anthropic",
+                model=model,
+                status_code=529,
+                retryable=True,
+                retry_after=retry_after,
+                delay_multiplier=self._overloaded_delay_multiplier,
+            )
+
+        if isinstance(e, AnthropicAPIStatusError):
+            status = getattr(e, "status_code", 500)
+            if status == 403:
+                # Distinguish Cloudflare bot challenges (transient) from
+                # real API 403s (permanent).  Cloudflare returns HTML
+                # challenge pages that the SDK can't parse as JSON, so
+                # e.body is None and content-type is text/html.
+                if self._is_cloudflare_challenge(e):
+                    logger.warning(
+                        "[PROVIDER] Cloudflare challenge detected (HTTP 403 "
+                        "with HTML body). Treating as transient — will retry."
+                    )
+                    return KernelProviderUnavailableError(
+                        "Cloudflare bot challenge (transient 403 with HTML body). "
+                        "This typically resolves on retry.",
+                        provider="anthropic",
+                        model=model,
+                        status_code=403,
+                        retryable=True,
+                    )
+                return KernelAccessDeniedError(
+                    error_msg, provider="anthropic", model=model, status_code=403
+                )
+            if status == 408:
+                # Server-side request timeout: transient, same as a client
+                # timeout from the caller's point of view.
+                return KernelLLMTimeoutError(
+                    error_msg,
+                    provider="anthropic",
+                    model=model,
+                    status_code=408,
+                    retryable=True,
+                )
+            if status == 404:
+                return KernelNotFoundError(
+                    error_msg, provider="anthropic", model=model, status_code=404
+                )
+            if status >= 500:
+                return KernelProviderUnavailableError(
+                    error_msg,
+                    provider="anthropic",
+                    model=model,
+                    status_code=status,
+                    retryable=True,
+                )
+            return KernelLLMError(
+                error_msg,
+                provider="anthropic",
+                model=model,
+                status_code=status,
+                retryable=False,
+            )
+
+        if isinstance(e, (asyncio.TimeoutError, AnthropicAPITimeoutError)):
+            return KernelLLMTimeoutError(
+                f"Request timed out after {timeout}s",
+                provider="anthropic",
+                model=model,
+                retryable=True,
+            )
+
+        return KernelLLMError(
+            error_msg or f"{type(e).__name__}: (no message)",
+            provider="anthropic",
+            model=model,
+            retryable=True,
+        )
+
     def _build_retry_config(self, max_retries: int) -> RetryConfig:
         """Create a retry config that preserves current backoff settings."""
         return RetryConfig(
@@ -1521,6 +1827,43 @@ class AnthropicProvider:
         if self.coordinator and hasattr(self.coordinator, "hooks"):
             await self.coordinator.hooks.emit(name, payload)
 
+    def _emit_nowait(
+        self,
+        name: str,
+        payload: dict[str, Any],
+        after: asyncio.Task | None = None,
+    ) -> asyncio.Task | None:
+        """Schedule a hook emission without waiting for its handlers.
+
+        The task is tracked in _pending_hook_tasks until it finishes so it is
+        never garbage-collected mid-flight. With ``after``, the emission waits
+        for that earlier one first, so chained events keep their order.
+        """
+        if not (self.coordinator and hasattr(self.coordinator, "hooks")):
+            return None
+        hooks = self.coordinator.hooks
+
+        async def _emit() -> Any:
+            await self._await_hook_task(after)
+            return await hooks.emit(name, payload)
+
+        task = asyncio.create_task(
+            _emit() if after is not None else hooks.emit(name, payload)
+        )
+        self._pending_hook_tasks.add(task)
+        task.add_done_callback(self._pending_hook_tasks.discard)
+        return task
+
+    @staticmethod
+    async def _await_hook_task(task: asyncio.Task | None) -> None:
+        """Wait for a scheduled emission; handler errors are logged, not raised."""
+        if task is None:
+            return
+        try:
+            await task
+        except Exception as e:
+            logger.warning("[PROVIDER] Hook handler failed: %s", e)
+
     async def _emit_active_fallback_window(
         self,
         requested_model: str,
@@ -1868,6 +2211,59 @@ class AnthropicProvider:
             if call_id not in tool_results and call_id not in self._repaired_tool_ids
         ]
 
+    async def _repair_missing_tool_results(self, request: ChatRequest) -> None:
+        """Inject synthetic results for unanswered tool calls, in place.
+
+        Shared by ``complete()`` and ``complete_batch()`` so both send
+        repaired histories.
+        """
+        # VALIDATE AND REPAIR: Check for missing tool results (backup safety net)
+        missing = self._find_missing_tool_results(request.messages)
+
+        if missing:
+            logger.warning(
+                f"[PROVIDER] Anthropic: Detected {len(missing)} missing tool result(s). "
+                f"Injecting synthetic errors. This indicates a bug in context management. "
+                f"Tool IDs: {[call_id for _, call_id, _, _ in missing]}"
+            )
+
+            # Group missing results by source assistant message index
+            # We need to insert synthetic results IMMEDIATELY after each assistant message
+            # that contains tool_use blocks (not at the end of the list)
+            from collections import defaultdict
+
+            by_msg_idx: dict[int, list[tuple[str, str]]] = defaultdict(list)
+            for msg_idx, call_id, tool_name, _ in missing:
+                by_msg_idx[msg_idx].append((call_id, tool_name))
+
+            # Insert synthetic results in reverse order of message index
+            # (so earlier insertions don't shift later indices)
+            for msg_idx in sorted(by_msg_idx.keys(), reverse=True):
+                synthetics = []
+                for call_id, tool_name in by_msg_idx[msg_idx]:
+                    synthetics.append(self._create_synthetic_result(call_id, tool_name))
+                    # Track this ID so we don't detect it as missing again in future iterations
+                    self._repaired_tool_ids.add(call_id)
+
+                # Insert all synthetic results immediately after the assistant message
+                insert_pos = msg_idx + 1
+                for i, synthetic in enumerate(synthetics):
+                    request.messages.insert(insert_pos + i, synthetic)
+
+            # Emit observability event
+            if self.coordinator and hasattr(self.coordinator, "hooks"):
+                await self.coordinator.hooks.emit(
+                    "provider:tool_sequence_repaired",
+                    {
+                        "provider": self.name,
+                        "repair_count": len(missing),
+                        "repairs": [
+                            {"tool_call_id": call_id, "tool_name": tool_name}
+                            for _, call_id, tool_name, _ in missing
+                        ],
+                    },
+                )
+
     def _create_synthetic_result(self, call_id: str, tool_name: str) -> Message:
         """Create synthetic error result for missing tool response.
 
@@ -1935,53 +2331,7 @@ class AnthropicProvider:
             ChatResponse with content blocks, tool calls, usage
         """
         await self._refresh_auth()
-
-        # VALIDATE AND REPAIR: Check for missing tool results (backup safety net)
-        missing = self._find_missing_tool_results(request.messages)
-
-        if missing:
-            logger.warning(
-                f"[PROVIDER] Anthropic: Detected {len(missing)} missing tool result(s). "
-                f"Injecting synthetic errors. This indicates a bug in context management. "
-                f"Tool IDs: {[call_id for _, call_id, _, _ in missing]}"
-            )
-
-            # Group missing results by source assistant message index
-            # We need to insert synthetic results IMMEDIATELY after each assistant message
-            # that contains tool_use blocks (not at the end of the list)
-            from collections import defaultdict
-
-            by_msg_idx: dict[int, list[tuple[str, str]]] = defaultdict(list)
-            for msg_idx, call_id, tool_name, _ in missing:
-                by_msg_idx[msg_idx].append((call_id, tool_name))
-
-            # Insert synthetic results in reverse order of message index
-            # (so earlier insertions don't shift later indices)
-            for msg_idx in sorted(by_msg_idx.keys(), reverse=True):
-                synthetics = []
-                for call_id, tool_name in by_msg_idx[msg_idx]:
-                    synthetics.append(self._create_synthetic_result(call_id, tool_name))
-                    # Track this ID so we don't detect it as missing again in future iterations
-                    self._repaired_tool_ids.add(call_id)
-
-                # Insert all synthetic results immediately after the assistant message
-                insert_pos = msg_idx + 1
-                for i, synthetic in enumerate(synthetics):
-                    request.messages.insert(insert_pos + i, synthetic)
-
-            # Emit observability event
-            if self.coordinator and hasattr(self.coordinator, "hooks"):
-                await self.coordinator.hooks.emit(
-                    "provider:tool_sequence_repaired",
-                    {
-                        "provider": self.name,
-                        "repair_count": len(missing),
-                        "repairs": [
-                            {"tool_call_id": call_id, "tool_name": tool_name}
-                            for _, call_id, tool_name, _ in missing
-                        ],
-                    },
-                )
+        await self._repair_missing_tool_results(request)
 
         if not self._fallback_on_overload:
             response = await self._complete_chat_request(request, **kwargs)
@@ -2067,6 +2417,220 @@ class AnthropicProvider:
                     **current_kwargs,
                 )
 
+    async def complete_many(
+        self,
+        requests: list[ChatRequest],
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> list[ChatResponse | BaseException]:
+        """
+        Run several completions concurrently.
+
+        All requests are scheduled up front and awaited together, so N calls
+        cost roughly one round-trip per ``max_concurrency`` batch instead of
+        N sequential round-trips. Each request goes through ``complete()``
+        (tool repair, retries, overload fallback, process-wide semaphore).
+
+        Args:
+            requests: Chat requests to complete
+            max_concurrency: Maximum in-flight requests for this call
+            **kwargs: Provider-specific options applied to every request
+
+        Returns:
+            Results in input order. A failed request yields its exception
+            instead of a ChatResponse; one failure never cancels the others.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _one(request: ChatRequest) -> ChatResponse:
+            async with semaphore:
+                return await self.complete(request, **kwargs)
+
+        return await asyncio.gather(
+            *(_one(request) for request in requests), return_exceptions=True
+        )
+
+    async def stream_complete(
+        self, request: ChatRequest, **kwargs
+    ) -> AsyncIterator[TextContent | ThinkingContent | ChatResponse]:
+        """
+        Stream a completion as it is generated.
+
+        Yields TextContent / ThinkingContent deltas as the API produces them,
+        then the final ChatResponse (same as ``complete()`` would return).
+        The request always streams, regardless of ``use_streaming``. The
+        llm:stream_block_* hook events are emitted as usual.
+
+        If a retry restarts the stream, deltas from the failed attempt have
+        already been yielded; the final ChatResponse is authoritative.
+
+        Args:
+            request: Typed chat request with messages, tools, config
+            **kwargs: Provider-specific options (override request fields)
+
+        Yields:
+            Content deltas, then the final ChatResponse
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        task = asyncio.create_task(self.complete(request, _delta_sink=queue, **kwargs))
+        task.add_done_callback(lambda _: queue.put_nowait(_STREAM_DONE))
+        try:
+            while (item := await queue.get()) is not _STREAM_DONE:
+                yield item
+            yield task.result()
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def complete_batch(
+        self,
+        requests: list[ChatRequest],
+        poll_interval: float = 10.0,
+        **kwargs,
+    ) -> list[ChatResponse | KernelLLMError]:
+        """
+        Run requests through the Message Batches API.
+
+        Intended for large offline workloads: batches are processed
+        asynchronously at reduced cost and do not count against real-time
+        rate limits, at the price of latency (minutes to hours). Params are
+        built exactly as for ``complete()`` (including tool repair); beta
+        headers from every request are sent once on the batch itself.
+
+        Args:
+            requests: Chat requests to submit as one batch
+            poll_interval: Seconds between batch status checks
+            **kwargs: Provider-specific options applied to every request
+
+        Returns:
+            Results in input order. A request that could not be built, or
+            that errored, expired or was canceled, yields a KernelLLMError
+            instead of a ChatResponse; it never fails the other requests.
+
+        Raises:
+            KernelLLMError: A batch API call failed after retries. Once the
+                batch was submitted, the error carries its ``batch_id`` so
+                the results can still be fetched later.
+        """
+        if not requests:
+            return []
+
+        await self._refresh_auth()
+
+        results: list[ChatResponse | KernelLLMError | None] = [None] * len(requests)
+        batch_requests: list[dict[str, Any]] = []
+        # _build_request_params resets the OAuth tool-name mapping per call,
+        # so keep each request's mapping for converting its result.
+        tool_names: dict[int, dict[str, str]] = {}
+        models: dict[int, str] = {}
+        beta_headers: list[str] = []
+        extra_headers: dict[str, str] = {}
+        for index, request in enumerate(requests):
+            await self._repair_missing_tool_results(request)
+            try:
+                params = (await self._build_request_params(request, **kwargs)).params
+            except KernelLLMError as e:
+                results[index] = e
+                continue
+            tool_names[index] = dict(self._oauth_tool_names)
+            models[index] = params["model"]
+            for name, value in params.pop("extra_headers", {}).items():
+                if name == "anthropic-beta":
+                    beta_headers.extend(value.split(","))
+                else:
+                    extra_headers[name] = value
+            batch_requests.append({"custom_id": str(index), "params": params})
+
+        if not batch_requests:
+            return [result for result in results if result is not None]
+
+        if beta_headers:
+            extra_headers["anthropic-beta"] = ",".join(
+                self._dedupe_headers(beta_headers)
+            )
+
+        async def _with_retry(operation: Callable[[], Any]) -> Any:
+            """Run one batch API operation with error translation and retry."""
+
+            async def _attempt() -> Any:
+                try:
+                    return await operation()
+                except KernelLLMError:
+                    raise
+                except Exception as e:
+                    raise self._translate_api_error(
+                        e, model=None, timeout=self.timeout
+                    ) from e
+
+            return await retry_with_backoff(_attempt, self._retry_config)
+
+        batch = await _with_retry(
+            lambda: self.client.messages.batches.create(
+                requests=batch_requests,
+                extra_headers=extra_headers or None,
+            )
+        )
+        logger.info(
+            "[PROVIDER] Submitted message batch %s with %d requests",
+            batch.id,
+            len(batch_requests),
+        )
+
+        try:
+            while batch.processing_status != "ended":
+                await asyncio.sleep(poll_interval)
+                batch = await _with_retry(
+                    lambda: self.client.messages.batches.retrieve(batch.id)
+                )
+            entries = await _with_retry(lambda: self._fetch_batch_results(batch.id))
+        except KernelLLMError as e:
+            # The batch is submitted (and billed); keep its id reachable.
+            e.batch_id = batch.id  # pyright: ignore[reportAttributeAccessIssue]
+            logger.error("[PROVIDER] Message batch %s abandoned: %s", batch.id, e)
+            raise
+
+        for entry in entries:
+            index = int(entry.custom_id)
+            model = models[index]
+            result = entry.result
+            if result.type == "succeeded":
+                results[index] = self._convert_to_chat_response(
+                    result.message, batch=True, tool_names=tool_names[index]
+                )
+            elif result.type == "errored":
+                error = result.error.error
+                error_cls = (
+                    KernelInvalidRequestError
+                    if error.type == "invalid_request_error"
+                    else KernelLLMError
+                )
+                results[index] = error_cls(
+                    error.message, provider="anthropic", model=model
+                )
+            else:
+                results[index] = KernelLLMError(
+                    f"Batch request {result.type}",
+                    provider="anthropic",
+                    model=model,
+                    retryable=True,
+                )
+
+        return [
+            result
+            if result is not None
+            else KernelLLMError(
+                "Missing from batch results", provider="anthropic", retryable=True
+            )
+            for result in results
+        ]
+
+    async def _fetch_batch_results(self, batch_id: str) -> list[Any]:
+        """Read every result entry of an ended message batch."""
+        return [
+            entry
+            async for entry in await self.client.messages.batches.results(batch_id)
+        ]
+
     def _extract_rate_limit_headers(
         self, headers: dict[str, str] | Any
     ) -> dict[str, Any]:
@@ -2226,16 +2790,14 @@ class AnthropicProvider:
         Returns:
             List of content blocks, or None if no system messages
         """
-        if not system_msgs:
-            return None
-
-        # Combine into single text (preserves current behavior)
-        combined = "\n\n".join(
-            m.content if isinstance(m.content, str) else "" for m in system_msgs
-        )
-
-        if not combined:
+        # Combine into single text; non-text and empty system messages are
+        # skipped so they don't leave stray separators behind.
+        system_parts = [
+            m.content for m in system_msgs if isinstance(m.content, str) and m.content
+        ]
+        if not system_parts:
             return None
+        combined = "\n\n".join(system_parts)
 
         block: dict[str, Any] = {"type": "text", "text": combined}
 
@@ -2277,36 +2839,38 @@ class AnthropicProvider:
             identity["cache_control"] = {"type": "ephemeral"}
         params["system"] = [identity, *(params.get("system") or [])]
 
-    async def _complete_chat_request(
-        self,
-        request: ChatRequest,
-        retry_config: RetryConfig | None = None,
-        **kwargs,
-    ) -> ChatResponse:
-        """Handle ChatRequest format with developer message conversion.
-
-        Args:
-            request: ChatRequest with messages
-            **kwargs: Additional parameters
+    async def _build_request_params(
+        self, request: ChatRequest, **kwargs
+    ) -> _RequestParams:
+        """Translate a ChatRequest into Anthropic messages.create params.
 
-        Returns:
-            ChatResponse with content blocks
+        Shared by the real-time path and the Message Batches path so both
+        send identical payloads (caching, thinking, beta headers, OAuth).
         """
-        active_retry_config = retry_config or self._retry_config
-
         logger.debug(
-            f"Received ChatRequest with {len(request.messages)} messages (raw={self.raw})"
+            "Received ChatRequest with %d messages (raw=%s)",
+            len(request.messages),
+            self.raw,
         )
 
-        # Separate messages by role
-        system_msgs = [m for m in request.messages if m.role == "system"]
-        developer_msgs = [m for m in request.messages if m.role == "developer"]
-        conversation = [
-            m for m in request.messages if m.role in ("user", "assistant", "tool")
-        ]
+        # Separate messages by role in a single pass
+        system_msgs: list[Message] = []
+        developer_msgs: list[Message] = []
+        conversation: list[Message] = []
+        for m in request.messages:
+            role = m.role
+            if role == "system":
+                system_msgs.append(m)
+            elif role == "developer":
+                developer_msgs.append(m)
+            elif role in ("user", "assistant", "tool"):
+                conversation.append(m)
 
         logger.debug(
-            f"Separated: {len(system_msgs)} system, {len(developer_msgs)} developer, {len(conversation)} conversation"
+            "Separated: %d system, %d developer, %d conversation",
+            len(system_msgs),
+            len(developer_msgs),
+            len(conversation),
         )
 
         # Format system messages as content block array (required for caching)
@@ -2314,40 +2878,51 @@ class AnthropicProvider:
 
         if system_blocks:
             logger.info(
-                f"[PROVIDER] System message length: {len(system_blocks[0]['text'])} chars (caching={'cache_control' in system_blocks[0]})"
+                "[PROVIDER] System message length: %d chars (caching=%s)",
+                len(system_blocks[0]["text"]),
+                "cache_control" in system_blocks[0],
             )
         else:
             logger.info("[PROVIDER] No system messages")
 
-        # Convert developer messages to XML-wrapped user messages (at top)
-        context_user_msgs = []
-        for i, dev_msg in enumerate(developer_msgs):
-            content = dev_msg.content if isinstance(dev_msg.content, str) else ""
-            content_preview = content[:100] + ("..." if len(content) > 100 else "")
+        # Convert developer messages to XML-wrapped user messages (at top).
+        # This is the only place context is wrapped; _convert_messages never
+        # receives developer messages.
+        context_texts = (
+            m.content if isinstance(m.content, str) else "" for m in developer_msgs
+        )
+        context_user_msgs = [
+            {"role": "user", "content": f"<context_file>\n{text}\n</context_file>"}
+            for text in context_texts
+        ]
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"[PROVIDER] Converting developer message {i + 1}/{len(developer_msgs)}: length={len(content)}"
+                "[PROVIDER] Created %d XML-wrapped context messages (%d chars)",
+                len(context_user_msgs),
+                sum(len(m["content"]) for m in context_user_msgs),
             )
-            logger.debug(f"[PROVIDER] Developer message preview: {content_preview}")
-            wrapped = f"<context_file>\n{content}\n</context_file>"
-            context_user_msgs.append({"role": "user", "content": wrapped})
-
-        logger.info(
-            f"[PROVIDER] Created {len(context_user_msgs)} XML-wrapped context messages"
-        )
 
         # Convert conversation messages
-        conversation_msgs = self._convert_messages(
-            [m.model_dump() for m in conversation]
-        )
+        conversation_msgs = self._convert_messages(conversation)
         logger.info(
-            f"[PROVIDER] Converted {len(conversation_msgs)} conversation messages"
+            "[PROVIDER] Converted %d conversation messages", len(conversation_msgs)
         )
+        # Repair ran in complete(); anything still unpaired would be rejected
+        # by the API, so fail here with every unmatched ID named instead.
+        try:
+            self._validate_anthropic_tool_consistency(conversation_msgs)
+        except ValueError as e:
+            raise KernelInvalidRequestError(
+                str(e),
+                provider="anthropic",
+                model=kwargs.get("model", self.default_model),
+            ) from e
 
         # Combine: context THEN conversation
         all_messages = context_user_msgs + conversation_msgs
         # Apply cache control to last message for incremental context caching
         all_messages = self._apply_message_cache_control(all_messages)
-        logger.info(f"[PROVIDER] Final message count for API: {len(all_messages)}")
+        logger.info("[PROVIDER] Final message count for API: %d", len(all_messages))
 
         # Resolve model and capabilities BEFORE building params dict,
         # so per-model param gating (temperature, output_config) can apply.
@@ -2720,27 +3295,139 @@ class AnthropicProvider:
             params["extra_headers"] = extra_headers
 
         self._apply_oauth_request_contract(params)
+        self._apply_context_cache_control(params, len(context_user_msgs))
 
         logger.info(
-            f"[PROVIDER] Anthropic API call - model: {params['model']}, messages: {len(params['messages'])}, system: {bool(params.get('system'))}, tools: {len(params.get('tools', []))}, thinking: {thinking_enabled}"
+            "[PROVIDER] Anthropic API call - model: %s, messages: %d, system: %s, "
+            "tools: %d, thinking: %s",
+            params["model"],
+            len(params["messages"]),
+            bool(params.get("system")),
+            len(params.get("tools", [])),
+            thinking_enabled,
         )
 
+        return _RequestParams(
+            params=params,
+            has_system=bool(system_blocks),
+            thinking_enabled=thinking_enabled,
+            thinking_budget=thinking_budget,
+            interleaved_thinking=interleaved_thinking_enabled,
+        )
+
+    @staticmethod
+    def _response_cache_key(params: dict[str, Any]) -> str | None:
+        """Stable hash of request params, or None if the request is not cacheable.
+
+        Only temperature=0 requests are cacheable; thinking forces 1.0 and
+        non-sampling models omit temperature, so both are excluded.
+        """
+        if params.get("temperature") != 0:
+            return None
+        canonical = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    async def _complete_chat_request(
+        self,
+        request: ChatRequest,
+        retry_config: RetryConfig | None = None,
+        **kwargs,
+    ) -> ChatResponse:
+        """Handle ChatRequest format with developer message conversion.
+
+        Args:
+            request: ChatRequest with messages
+            **kwargs: Additional parameters
+
+        Returns:
+            ChatResponse with content blocks
+        """
+        active_retry_config = retry_config or self._retry_config
+
+        try:
+            built = await self._build_request_params(request, **kwargs)
+        except KernelLLMError as e:
+            # Rejected locally (e.g. unpaired tool blocks), so nothing was
+            # sent: report it as an error llm:response, as for an API 400.
+            error_msg = str(e) or f"{type(e).__name__}: (no message)"
+            logger.error("[PROVIDER] Anthropic request rejected: %s", error_msg)
+            if self.coordinator and hasattr(self.coordinator, "hooks"):
+                await self.coordinator.hooks.emit(
+                    "llm:response",
+                    {
+                        "provider": "anthropic",
+                        "model": e.model or kwargs.get("model", self.default_model),
+                        "status": "error",
+                        "duration_ms": 0,
+                        "error": error_msg,
+                    },
+                )
+            raise
+        params = built.params
+
+        cache_key = (
+            self._response_cache_key(params) if self._response_cache_enabled else None
+        )
+        if cache_key is not None and cache_key in self._response_cache:
+            self._response_cache.move_to_end(cache_key)
+            logger.debug("[PROVIDER] Response cache hit: %s", cache_key)
+            if self.coordinator and hasattr(self.coordinator, "hooks"):
+                await self.coordinator.hooks.emit(
+                    PROVIDER_RESPONSE_CACHE_HIT,
+                    {
+                        "provider": self.name,
+                        "model": params["model"],
+                        "cache_key": cache_key,
+                    },
+                )
+            cached = self._response_cache[cache_key].model_copy(deep=True)
+            # Nothing is billed for a hit: zero the usage so callers summing
+            # response.usage do not count the original call twice.
+            cached.usage = Usage(
+                input_tokens=0, output_tokens=0, total_tokens=0, cost_usd=Decimal("0")
+            )
+            cached.metadata = {**(cached.metadata or {}), "response_cache_hit": True}
+            return cached
+
         # Emit llm:request event
+        request_emit: asyncio.Task | None = None
         if self.coordinator and hasattr(self.coordinator, "hooks"):
             request_payload: dict[str, Any] = {
                 "provider": "anthropic",
                 "model": params["model"],
                 "message_count": len(params["messages"]),
-                "has_system": bool(system_blocks),
-                "thinking_enabled": thinking_enabled,
-                "thinking_budget": thinking_budget,
-                "interleaved_thinking": interleaved_thinking_enabled,
+                "has_system": built.has_system,
+                "thinking_enabled": built.thinking_enabled,
+                "thinking_budget": built.thinking_budget,
+                "interleaved_thinking": built.interleaved_thinking,
             }
             if self.raw:
                 request_payload["raw"] = redact_secrets(params)
-            await self.coordinator.hooks.emit("llm:request", request_payload)
+            # Not awaited: the API call should not wait on request handlers.
+            # Pre-call events (concurrency, throttle) are chained behind it by
+            # _emit_before_call, and _emit_in_call awaits the chain before
+            # this call's next event (stream blocks, retries, llm:response),
+            # so ordering is kept.
+            request_emit = self._emit_nowait("llm:request", request_payload)
+
+        def _emit_before_call(name: str, payload: dict[str, Any]) -> None:
+            """Queue a pre-call event behind llm:request without blocking."""
+            nonlocal request_emit
+            request_emit = self._emit_nowait(name, payload, after=request_emit)
+
+        async def _emit_in_call(name: str, payload: dict[str, Any]) -> None:
+            """Emit an event for this call, letting llm:request finish first."""
+            nonlocal request_emit
+            if request_emit is not None:
+                await self._await_hook_task(request_emit)
+                request_emit = None
+            await self.coordinator.hooks.emit(name, payload)
 
-        start_time = time.time()
+        # ChatRequest.timeout overrides the configured timeout for this call.
+        request_timeout = getattr(request, "timeout", None) or self.timeout
+        delta_sink: asyncio.Queue | None = kwargs.get("_delta_sink")
+
+        start_perf = time.perf_counter()
 
         # Call Anthropic API with shared retry_with_backoff from amplifier-core.
         # Error translation happens inside _do_complete() so that retry_with_backoff
@@ -2767,6 +3454,9 @@ class AnthropicProvider:
                 _use_streaming = self.use_streaming
                 if isinstance(_metadata, dict) and _metadata.get("stream") is False:
                     _use_streaming = False
+                # stream_complete() needs deltas, so it always streams.
+                if delta_sink is not None:
+                    _use_streaming = True
 
                 if _use_streaming:
                     # ----- Streaming path with per-block event emission --------
@@ -2808,7 +3498,7 @@ class AnthropicProvider:
                         self.coordinator, "hooks"
                     )
                     try:
-                        async with asyncio.timeout(self.timeout):
+                        async with asyncio.timeout(request_timeout):
                             async with self.client.messages.stream(**params) as stream:
                                 async for event in stream:
                                     etype = type(event).__name__
@@ -2839,7 +3529,7 @@ class AnthropicProvider:
                                                 name = getattr(block, "name", None)
                                                 if name:
                                                     payload["name"] = name
-                                            await self.coordinator.hooks.emit(
+                                            await _emit_in_call(
                                                 "llm:stream_block_start",
                                                 payload,
                                             )
@@ -2852,8 +3542,12 @@ class AnthropicProvider:
                                         dtype = getattr(delta, "type", "")
                                         if dtype == "text_delta":
                                             text = getattr(delta, "text", "") or ""
+                                            if text and delta_sink is not None:
+                                                delta_sink.put_nowait(
+                                                    TextContent(text=text)
+                                                )
                                             if text and hooks_available:
-                                                await self.coordinator.hooks.emit(
+                                                await _emit_in_call(
                                                     "llm:stream_block_delta",
                                                     {
                                                         "request_id": request_id,
@@ -2868,8 +3562,12 @@ class AnthropicProvider:
                                                 partial_emitted = True
                                         elif dtype == "thinking_delta":
                                             text = getattr(delta, "thinking", "") or ""
+                                            if text and delta_sink is not None:
+                                                delta_sink.put_nowait(
+                                                    ThinkingContent(text=text)
+                                                )
                                             if text and hooks_available:
-                                                await self.coordinator.hooks.emit(
+                                                await _emit_in_call(
                                                     "llm:stream_block_delta",
                                                     {
                                                         "request_id": request_id,
@@ -2894,7 +3592,7 @@ class AnthropicProvider:
                                             continue
                                         if hooks_available:
                                             btype_end = block_types.get(idx, "text")
-                                            await self.coordinator.hooks.emit(
+                                            await _emit_in_call(
                                                 "llm:stream_block_end",
                                                 {
                                                     "request_id": request_id,
@@ -2922,7 +3620,7 @@ class AnthropicProvider:
                         # clauses below translate the SDK error to a kernel
                         # error type.
                         if partial_emitted and hooks_available:
-                            await self.coordinator.hooks.emit(
+                            await _emit_in_call(
                                 "llm:stream_aborted",
                                 {
                                     "request_id": request_id,
@@ -2934,10 +3632,12 @@ class AnthropicProvider:
                             )
                         raise
                 else:
-                    # Use with_raw_response to access headers
-                    raw_response = await asyncio.wait_for(
-                        self.client.messages.with_raw_response.create(**params),
-                        timeout=self.timeout,
+                    # Use with_raw_response to access headers. The timeout is
+                    # enforced by httpx at the socket level, so an expired
+                    # request closes its connection cleanly instead of being
+                    # cancelled mid-read by an asyncio timer.
+                    raw_response = await self.client.messages.with_raw_response.create(
+                        **params, timeout=request_timeout
                     )
                     response = raw_response.parse()
                     rate_limit_info = self._extract_rate_limit_headers(
@@ -2947,169 +3647,33 @@ class AnthropicProvider:
                 captured_rate_limit_info = rate_limit_info
                 return response
 
-            except AnthropicRateLimitError as e:
-                rate_info = self._parse_rate_limit_info(e)
-                retry_after = rate_info.get("retry_after_seconds")
-                body = getattr(e, "body", None)
-                msg = json.dumps(body) if body is not None else str(e)
-                raise KernelRateLimitError(
-                    msg,
-                    provider="anthropic",
-                    model=params["model"],
-                    status_code=429,
-                    retryable=True,
-                    retry_after=retry_after,
-                ) from e
-
-            except AnthropicAuthenticationError as e:
-                body = getattr(e, "body", None)
-                msg = json.dumps(body) if body is not None else str(e)
-                raise KernelAuthenticationError(
-                    msg,
-                    provider="anthropic",
-                    model=params["model"],
-                    status_code=getattr(e, "status_code", 401),
-                ) from e
-
-            except AnthropicBadRequestError as e:
-                raw_msg = str(e).lower()
-                body = getattr(e, "body", None)
-                error_msg = json.dumps(body) if body is not None else str(e)
-                if "context length" in raw_msg or "too many tokens" in raw_msg:
-                    raise KernelContextLengthError(
-                        error_msg,
-                        provider="anthropic",
-                        model=params["model"],
-                        status_code=getattr(e, "status_code", 400),
-                    ) from e
-                elif (
-                    "content filter" in raw_msg
-                    or "safety" in raw_msg
-                    or "blocked" in raw_msg
-                ):
-                    raise KernelContentFilterError(
-                        error_msg,
-                        provider="anthropic",
-                        model=params["model"],
-                        status_code=getattr(e, "status_code", 400),
-                    ) from e
-                else:
-                    raise KernelInvalidRequestError(
-                        error_msg,
-                        provider="anthropic",
-                        model=params["model"],
-                        status_code=getattr(e, "status_code", 400),
-                    ) from e
-
-            except AnthropicOverloadedError as e:
-                body = getattr(e, "body", None)
-                error_msg = json.dumps(body) if body is not None else str(e)
-                retry_after: float | None = None
-                if hasattr(e, "response") and e.response:
-                    raw = e.response.headers.get("retry-after")
-                    if raw is not None:
-                        try:
-                            retry_after = float(raw)
-                        except (ValueError, TypeError):
-                            pass
-                raise KernelProviderUnavailableError(
-                    error_msg,
-                    provider="anthropic",
-                    model=params["model"],
-                    status_code=529,
-                    retryable=True,
-                    retry_after=retry_after,
-                    delay_multiplier=self._overloaded_delay_multiplier,
-                ) from e
-
-            except AnthropicAPIStatusError as e:
-                status = getattr(e, "status_code", 500)
-                body = getattr(e, "body", None)
-                error_msg = json.dumps(body) if body is not None else str(e)
-                if status == 403:
-                    # Distinguish Cloudflare bot challenges (transient) from
-                    # real API 403s (permanent).  Cloudflare returns HTML
-                    # challenge pages that the SDK can't parse as JSON, so
-                    # e.body is None and content-type is text/html.
-                    if self._is_cloudflare_challenge(e):
-                        logger.warning(
-                            "[PROVIDER] Cloudflare challenge detected (HTTP 403 "
-                            "with HTML body). Treating as transient — will retry."
-                        )
-                        if self.coordinator and hasattr(self.coordinator, "hooks"):
-                            await self.coordinator.hooks.emit(
-                                "provider:cloudflare_challenge",
-                                {
-                                    "provider": "anthropic",
-                                    "model": params["model"],
-                                    "active_requests": _active_requests,
-                                    "waiting_requests": _waiting_requests,
-                                    "max_concurrent": self._max_concurrent_requests,
-                                    "process_id": os.getpid(),
-                                    "timestamp": time.time(),
-                                },
-                            )
-                        raise KernelProviderUnavailableError(
-                            "Cloudflare bot challenge (transient 403 with HTML body). "
-                            "This typically resolves on retry.",
-                            provider="anthropic",
-                            model=params["model"],
-                            status_code=403,
-                            retryable=True,
-                        ) from e
-                    raise KernelAccessDeniedError(
-                        error_msg,
-                        provider="anthropic",
-                        model=params["model"],
-                        status_code=403,
-                    ) from e
-                if status == 404:
-                    raise KernelNotFoundError(
-                        error_msg,
-                        provider="anthropic",
-                        model=params["model"],
-                        status_code=404,
-                    ) from e
-                if status >= 500:
-                    raise KernelProviderUnavailableError(
-                        error_msg,
-                        provider="anthropic",
-                        model=params["model"],
-                        status_code=status,
-                        retryable=True,
-                    ) from e
-                raise KernelLLMError(
-                    error_msg,
-                    provider="anthropic",
-                    model=params["model"],
-                    status_code=status,
-                    retryable=False,
-                ) from e
-
-            except asyncio.TimeoutError as e:
-                raise KernelLLMTimeoutError(
-                    f"Request timed out after {self.timeout}s",
-                    provider="anthropic",
-                    model=params["model"],
-                    retryable=True,
-                ) from e
-
             except KernelLLMError:
                 raise  # Already translated, don't double-wrap
 
             except Exception as e:
-                body = getattr(e, "body", None)
-                error_msg = (
-                    json.dumps(body)
-                    if body is not None
-                    else (str(e) or f"{type(e).__name__}: (no message)")
+                error = self._translate_api_error(
+                    e, model=params["model"], timeout=request_timeout
                 )
-                raise KernelLLMError(
-                    error_msg,
-                    provider="anthropic",
-                    model=params["model"],
-                    retryable=True,
-                ) from e
+                if (
+                    isinstance(e, AnthropicAPIStatusError)
+                    and isinstance(error, KernelProviderUnavailableError)
+                    and error.status_code == 403
+                    and self.coordinator
+                    and hasattr(self.coordinator, "hooks")
+                ):
+                    await _emit_in_call(
+                        "provider:cloudflare_challenge",
+                        {
+                            "provider": "anthropic",
+                            "model": params["model"],
+                            "active_requests": _active_requests,
+                            "waiting_requests": _waiting_requests,
+                            "max_concurrent": self._max_concurrent_requests,
+                            "process_id": os.getpid(),
+                            "timestamp": time.time(),
+                        },
+                    )
+                raise error from e
 
         async def _on_retry(attempt: int, delay: float, error: KernelLLMError):
             """Callback invoked before each retry sleep."""
@@ -3128,7 +3692,7 @@ class AnthropicProvider:
             )
 
             if self.coordinator and hasattr(self.coordinator, "hooks"):
-                await self.coordinator.hooks.emit(
+                await _emit_in_call(
                     PROVIDER_RETRY,
                     {
                         "provider": "anthropic",
@@ -3162,7 +3726,7 @@ class AnthropicProvider:
                     _active_requests += 1
                     try:
                         if self.coordinator and hasattr(self.coordinator, "hooks"):
-                            await self.coordinator.hooks.emit(
+                            _emit_before_call(
                                 "provider:concurrency",
                                 {
                                     "provider": "anthropic",
@@ -3181,7 +3745,7 @@ class AnthropicProvider:
                 _active_requests += 1
                 try:
                     if self.coordinator and hasattr(self.coordinator, "hooks"):
-                        await self.coordinator.hooks.emit(
+                        _emit_before_call(
                             "provider:concurrency",
                             {
                                 "provider": "anthropic",
@@ -3237,7 +3801,7 @@ class AnthropicProvider:
 
                 # Emit throttle event so CLI can warn the user
                 if self.coordinator and hasattr(self.coordinator, "hooks"):
-                    await self.coordinator.hooks.emit(
+                    _emit_before_call(
                         PROVIDER_THROTTLE,
                         {
                             "provider": "anthropic",
@@ -3261,10 +3825,10 @@ class AnthropicProvider:
                 on_retry=_on_retry,
             )
 
-            elapsed_ms = int((time.time() - start_time) * 1000)
+            elapsed_ms = int((time.perf_counter() - start_perf) * 1000)
 
             logger.info("[PROVIDER] Received response from Anthropic API")
-            logger.debug(f"[PROVIDER] Response type: {response.model}")
+            logger.debug("[PROVIDER] Response type: %s", response.model)
 
             # Log rate limit status if available
             rate_limit_info = captured_rate_limit_info
@@ -3273,7 +3837,7 @@ class AnthropicProvider:
             # Write shared state so sibling processes can see current capacity.
             if rate_limit_info:
                 self._write_shared_rate_limit_state(rate_limit_info)
-            if rate_limit_info:
+            if rate_limit_info and logger.isEnabledFor(logging.DEBUG):
                 tokens_remaining = rate_limit_info.get("tokens_remaining")
                 tokens_limit = rate_limit_info.get("tokens_limit")
                 if tokens_remaining is not None and tokens_limit is not None:
@@ -3283,7 +3847,10 @@ class AnthropicProvider:
                         else 0
                     )
                     logger.debug(
-                        f"[PROVIDER] Rate limit: {tokens_remaining:,}/{tokens_limit:,} tokens remaining ({pct_used:.1f}% used)"
+                        "[PROVIDER] Rate limit: %s/%s tokens remaining (%.1f%% used)",
+                        f"{tokens_remaining:,}",
+                        f"{tokens_limit:,}",
+                        pct_used,
                     )
 
             # Build ChatResponse first
@@ -3318,18 +3885,23 @@ class AnthropicProvider:
                     response_event["rate_limits"] = rate_limit_info
                 if self.raw:
                     response_event["raw"] = redact_secrets(response.model_dump())
-                await self.coordinator.hooks.emit("llm:response", response_event)
+                await _emit_in_call("llm:response", response_event)
+
+            if cache_key is not None:
+                self._response_cache[cache_key] = chat_response.model_copy(deep=True)
+                if len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
 
             return chat_response  # Return the already-built response
 
         except KernelLLMError as e:
             # Phase 2: Kernel error types — emit llm:response error event, then propagate
-            elapsed_ms = int((time.time() - start_time) * 1000)
+            elapsed_ms = int((time.perf_counter() - start_perf) * 1000)
             error_msg = str(e) or f"{type(e).__name__}: (no message)"
             logger.error("[PROVIDER] Anthropic API error: %s", error_msg)
 
             if self.coordinator and hasattr(self.coordinator, "hooks"):
-                await self.coordinator.hooks.emit(
+                await _emit_in_call(
                     "llm:response",
                     {
                         "provider": "anthropic",
@@ -3342,14 +3914,14 @@ class AnthropicProvider:
             raise
 
         except Exception as e:
-            elapsed_ms = int((time.time() - start_time) * 1000)
+            elapsed_ms = int((time.perf_counter() - start_perf) * 1000)
             # Ensure error message is never empty
             error_msg = str(e) or f"{type(e).__name__}: (no message)"
             logger.error(f"[PROVIDER] Anthropic response processing error: {error_msg}")
 
             # Emit error event
             if self.coordinator and hasattr(self.coordinator, "hooks"):
-                await self.coordinator.hooks.emit(
+                await _emit_in_call(
                     "llm:response",
                     {
                         "provider": "anthropic",
@@ -3384,7 +3956,7 @@ class AnthropicProvider:
             # Skip tool calls with truly missing arguments (None).
             # Empty dict {} is valid -- many tools take no arguments.
             if tc.arguments is None:
-                logger.debug(f"Filtering out tool '{tc.name}' with None arguments")
+                logger.debug("Filtering out tool '%s' with None arguments", tc.name)
                 continue
             valid_calls.append(tc)
 
@@ -3445,7 +4017,38 @@ class AnthropicProvider:
         cleaned.pop("visibility", None)
         return cleaned
 
-    def _convert_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    @staticmethod
+    def _message_as_dict(message: Message | dict[str, Any]) -> dict[str, Any]:
+        """Shallow dict view of a Message for _convert_messages.
+
+        Unlike model_dump(), string content and plain-dict extras (tool_calls,
+        thinking_block) are passed through by reference; only nested models
+        such as content blocks or ToolCall objects are dumped.
+        """
+        if isinstance(message, dict):
+            return message
+
+        def _plain(value: Any) -> Any:
+            if hasattr(value, "model_dump"):
+                return value.model_dump()
+            if isinstance(value, list):
+                return [
+                    v.model_dump() if hasattr(v, "model_dump") else v for v in value
+                ]
+            return value
+
+        data: dict[str, Any] = {
+            "role": message.role,
+            "content": _plain(message.content),
+            "tool_call_id": message.tool_call_id,
+        }
+        for key, value in (message.model_extra or {}).items():
+            data[key] = _plain(value)
+        return data
+
+    def _convert_messages(
+        self, messages: Sequence[Message | dict[str, Any]]
+    ) -> list[dict[str, Any]]:
         """Convert messages to Anthropic format.
 
         CRITICAL: Anthropic requires ALL tool_result blocks from one assistant's tool_use
@@ -3457,7 +4060,12 @@ class AnthropicProvider:
         DEFENSIVE: Also validates that each tool_result has a corresponding tool_use
         in a preceding assistant message. Orphaned tool_results (from context compaction)
         are skipped to avoid API errors.
+
+        Accepts Message objects or their dict form. Developer messages are not
+        expected here: _build_request_params wraps them as context up front.
         """
+        messages = [self._message_as_dict(m) for m in messages]
+
         # First pass: collect all valid tool_use_ids from assistant messages
         valid_tool_use_ids: set[str] = set()
         for msg in messages:
@@ -3482,10 +4090,12 @@ class AnthropicProvider:
                             elif block.get("type") == "tool_call" and block.get("id"):
                                 valid_tool_use_ids.add(block["id"])
 
-        anthropic_messages = []
+        anthropic_messages: list[dict[str, Any]] = []
+        append_message = anthropic_messages.append
+        n = len(messages)
         i = 0
 
-        while i < len(messages):
+        while i < n:
             msg = messages[i]
             role = msg.get("role")
             content = msg.get("content", "")
@@ -3500,8 +4110,10 @@ class AnthropicProvider:
                 # Collect all consecutive tool results, but only valid ones
                 tool_results = []
                 skipped_count = 0
-                while i < len(messages) and messages[i].get("role") == "tool":
+                while i < n:
                     tool_msg = messages[i]
+                    if tool_msg.get("role") != "tool":
+                        break
                     tool_use_id = tool_msg.get("tool_call_id")
 
                     # DEFENSIVE: Skip tool_results without valid tool_use_id
@@ -3526,7 +4138,7 @@ class AnthropicProvider:
 
                 # Only add user message if we have valid tool_results
                 if tool_results:
-                    anthropic_messages.append(
+                    append_message(
                         {
                             "role": "user",
                             "content": tool_results,  # Array of tool_result blocks
@@ -3583,19 +4195,17 @@ class AnthropicProvider:
                             content_blocks.append({"type": "text", "text": content})
 
                     # Add tool_use blocks
-                    for tc in msg["tool_calls"]:
-                        content_blocks.append(
-                            {
-                                "type": "tool_use",
-                                "id": tc.get("id", ""),
-                                "name": tc.get("tool", ""),
-                                "input": tc.get("arguments", {}),
-                            }
-                        )
-
-                    anthropic_messages.append(
-                        {"role": "assistant", "content": content_blocks}
+                    content_blocks.extend(
+                        {
+                            "type": "tool_use",
+                            "id": tc.get("id", ""),
+                            "name": tc.get("tool", ""),
+                            "input": tc.get("arguments", {}),
+                        }
+                        for tc in msg["tool_calls"]
                     )
+
+                    append_message({"role": "assistant", "content": content_blocks})
                 elif "thinking_block" in msg and msg["thinking_block"]:
                     # Assistant message with thinking block
                     # Clean thinking block (remove visibility field not accepted by API)
@@ -3626,9 +4236,7 @@ class AnthropicProvider:
                         else:
                             # Content is a simple string
                             content_blocks.append({"type": "text", "text": content})
-                    anthropic_messages.append(
-                        {"role": "assistant", "content": content_blocks}
-                    )
+                    append_message({"role": "assistant", "content": content_blocks})
                 else:
                     # Regular assistant message - may have structured content blocks
                     if isinstance(content, list):
@@ -3636,19 +4244,10 @@ class AnthropicProvider:
                         cleaned_blocks = [
                             self._clean_content_block(block) for block in content
                         ]
-                        anthropic_messages.append(
-                            {"role": "assistant", "content": cleaned_blocks}
-                        )
+                        append_message({"role": "assistant", "content": cleaned_blocks})
                     else:
                         # Content is a simple string
-                        anthropic_messages.append(
-                            {"role": "assistant", "content": content}
-                        )
-                i += 1
-            elif role == "developer":
-                # Developer messages -> XML-wrapped user messages (context files)
-                wrapped = f"<context_file>\n{content}\n</context_file>"
-                anthropic_messages.append({"role": "user", "content": wrapped})
+                        append_message({"role": "assistant", "content": content})
                 i += 1
             else:
                 # User messages - handle structured content (text + images)
@@ -3683,16 +4282,104 @@ class AnthropicProvider:
                                     )
 
                     if content_blocks:
-                        anthropic_messages.append(
-                            {"role": "user", "content": content_blocks}
-                        )
+                        append_message({"role": "user", "content": content_blocks})
                 else:
                     # Simple string content
-                    anthropic_messages.append({"role": "user", "content": content})
+                    append_message({"role": "user", "content": content})
                 i += 1
 
         return anthropic_messages
 
+    def _validate_anthropic_tool_consistency(
+        self, messages: list[dict[str, Any]]
+    ) -> None:
+        """Strictly validate tool_use/tool_result pairing in Anthropic messages.
+
+        Operates on the output of _convert_messages (after repair): every
+        assistant tool_use must be answered by a tool_result in the very next
+        (user) message, and every tool_result must answer a tool_use from the
+        immediately preceding assistant message.
+
+        Matching is two set differences per message pair: the assistant's
+        tool_use IDs against the keys of the following message's tool_results
+        (indexed by tool_use_id). Every unmatched ID on either side is
+        reported in the error. Like _convert_messages, ``tool_call`` content
+        blocks count as tool_use.
+
+        IDs in ``_repaired_tool_ids`` are exempt from needing a result: their
+        synthetic results were injected into an earlier request only, so
+        later sends legitimately carry the tool_use unanswered.
+
+        Args:
+            messages: Anthropic-format messages from _convert_messages.
+
+        Raises:
+            ValueError: Describing the first inconsistency found.
+        """
+        # Fast path: plain chat turns (string content, no tool blocks) have
+        # nothing to pair, so skip the per-block walk entirely.
+        if not any(
+            isinstance(msg.get("content"), list)
+            and any(
+                isinstance(block, dict) and block.get("type") in _TOOL_BLOCK_TYPES
+                for block in msg["content"]
+            )
+            for msg in messages
+        ):
+            return
+
+        n = len(messages)
+        use_ids: set[str] = set()
+        for idx in range(n):
+            msg = messages[idx]
+            content = msg.get("content")
+
+            # One pass per message: read each block's type once and sort it
+            # into this message's tool_use IDs or tool_results.
+            message_use_ids: set[str] = set()
+            result_by_id: dict[Any, dict[str, Any]] = {}
+            if isinstance(content, list):
+                add_use_id = message_use_ids.add
+                for block in content:
+                    if not isinstance(block, dict):
+                        continue
+                    block_type = block.get("type")
+                    if block_type == "tool_result":
+                        result_by_id[block.get("tool_use_id")] = block
+                    elif block_type in _TOOL_USE_BLOCK_TYPES:
+                        tool_use_id = block.get("id")
+                        if not tool_use_id:
+                            raise ValueError(
+                                f"Message {idx}: {block_type} block without id"
+                            )
+                        add_use_id(tool_use_id)
+
+            orphaned = result_by_id.keys() - use_ids
+            if orphaned:
+                raise ValueError(
+                    f"Message {idx}: tool_result id(s) {sorted(orphaned, key=str)!r} "
+                    "without matching tool_use in the preceding assistant message"
+                )
+            missing = use_ids - result_by_id.keys() - self._repaired_tool_ids
+            if missing:
+                raise ValueError(
+                    f"Message {idx - 1}: tool_use id(s) {sorted(missing)!r} "
+                    "without matching tool_result"
+                )
+
+            use_ids = message_use_ids if msg.get("role") == "assistant" else set()
+            if not use_ids - self._repaired_tool_ids:
+                continue
+            if idx + 1 >= n:
+                raise ValueError(
+                    f"Message {idx}: assistant has tool_use blocks but no following message"
+                )
+            if messages[idx + 1].get("role") != "user":
+                raise ValueError(
+                    f"Message {idx}: assistant has tool_use blocks, expected 'user' "
+                    f"with tool_results next but got {messages[idx + 1].get('role')!r}"
+                )
+
     def _convert_tools_from_request(self, tools: list) -> list[dict[str, Any]]:
         """Convert ToolSpec objects from ChatRequest to Anthropic format.
 
@@ -3703,12 +4390,31 @@ class AnthropicProvider:
         'function'. These tools use Anthropic's built-in capabilities and should
         NOT be converted to the standard function tool format.
 
+        Conversions are cached by tool-object identity, since agent loops pass
+        the same ToolSpec objects every turn. Each call returns fresh top-level
+        dicts because later steps (cache_control, OAuth renaming) mutate them.
+
         Args:
             tools: List of ToolSpec objects or native tool definitions
 
         Returns:
             List of Anthropic-formatted tool definitions
         """
+        key = tuple(id(tool) for tool in tools)
+        cached = self._tools_cache.get(key)
+        # The cached tuple holds references, so ids cannot have been recycled.
+        if cached is not None and all(a is b for a, b in zip(cached[0], tools)):
+            self._tools_cache.move_to_end(key)
+            return [dict(tool) for tool in cached[1]]
+
+        anthropic_tools = self._build_anthropic_tools(tools)
+        self._tools_cache[key] = (tuple(tools), anthropic_tools)
+        if len(self._tools_cache) > _TOOLS_CACHE_SIZE:
+            self._tools_cache.popitem(last=False)
+        return [dict(tool) for tool in anthropic_tools]
+
+    def _build_anthropic_tools(self, tools: list) -> list[dict[str, Any]]:
+        """Uncached conversion behind _convert_tools_from_request."""
         anthropic_tools = []
         for tool in tools:
             # Check if this is a model-native tool (has 'type' that's not 'function')
@@ -3734,7 +4440,7 @@ class AnthropicProvider:
                     ):
                         native_tool["user_location"] = tool.user_location
                     anthropic_tools.append(native_tool)
-                logger.debug(f"[PROVIDER] Added native tool: {tool_type}")
+                logger.debug("[PROVIDER] Added native tool: %s", tool_type)
             else:
                 # Standard function tool - convert to Anthropic format
                 anthropic_tools.append(
@@ -3897,85 +4603,143 @@ class AnthropicProvider:
 
         return messages
 
-    def _convert_to_chat_response(self, response: Any) -> ChatResponse:
+    @staticmethod
+    def _count_cache_breakpoints(params: dict[str, Any]) -> int:
+        """Count cache_control markers across system, tools, and messages."""
+        blocks: list[Any] = [*(params.get("system") or []), *params.get("tools", [])]
+        for message in params.get("messages", []):
+            content = message.get("content")
+            if isinstance(content, list):
+                blocks.extend(content)
+        return sum(
+            1
+            for block in blocks
+            if isinstance(block, dict) and "cache_control" in block
+        )
+
+    def _apply_context_cache_control(
+        self, params: dict[str, Any], context_count: int
+    ) -> None:
+        """Add a cache breakpoint after the developer context messages.
+
+        Context files sit between the system prompt and the conversation and
+        rarely change between turns. A breakpoint at their end keeps that
+        prefix cached even when the conversation tail changes (e.g. after
+        compaction), where the last-message breakpoint alone would miss.
+
+        Only applied while a breakpoint slot remains, so OAuth requests (which
+        spend one on the Claude Code identity block) never exceed the limit.
+        """
+        if not self.enable_prompt_caching or context_count <= 0:
+            return
+
+        messages = params.get("messages", [])
+        # When context is the whole message list, the last-message breakpoint
+        # already covers it.
+        if context_count >= len(messages):
+            return
+        if self._count_cache_breakpoints(params) >= _MAX_CACHE_BREAKPOINTS:
+            return
+
+        last_context = messages[context_count - 1]
+        content = last_context.get("content")
+        if isinstance(content, str):
+            last_context["content"] = [
+                {
+                    "type": "text",
+                    "text": content,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+
+    def _add_text_block(self, block: Any, parts: _ResponseParts) -> None:
+        parts.content.append(TextBlock(text=block.text))
+        parts.text.append(block.text)
+        parts.events.append(TextContent(text=block.text))
+
+    def _add_thinking_block(self, block: Any, parts: _ResponseParts) -> None:
+        parts.content.append(
+            ThinkingBlock(
+                thinking=block.thinking,
+                signature=getattr(block, "signature", None),
+                visibility="internal",
+            )
+        )
+        parts.events.append(ThinkingContent(text=block.thinking))
+        # NOTE: Do NOT add thinking to parts.text - it's internal process, not response content
+
+    def _add_tool_use_block(self, block: Any, parts: _ResponseParts) -> None:
+        tool_name = parts.tool_names.get(block.name.lower(), block.name)
+        parts.content.append(
+            ToolCallBlock(id=block.id, name=tool_name, input=block.input)
+        )
+        parts.tool_calls.append(
+            ToolCall(id=block.id, name=tool_name, arguments=block.input)
+        )
+        parts.events.append(
+            ToolCallContent(id=block.id, name=tool_name, arguments=block.input)
+        )
+
+    def _add_web_search_block(self, block: Any, parts: _ResponseParts) -> None:
+        # Handle native web search results from Anthropic
+        # Extract citations from search results for observability
+        citations = self._extract_web_search_citations(block)
+        parts.web_search_results.append(
+            {
+                "type": "web_search_tool_result",
+                "tool_use_id": getattr(block, "tool_use_id", None),
+                "citations": citations,
+            }
+        )
+        # Add to event blocks for UI display
+        parts.events.append(
+            WebSearchContent(
+                query=getattr(block, "query", ""),
+                citations=citations,
+            )
+        )
+        logger.debug("[PROVIDER] Web search returned %d citations", len(citations))
+
+    # Response content block type -> handler method name, looked up on the
+    # instance so subclasses can override a handler (see _convert_to_chat_response)
+    _RESPONSE_BLOCK_HANDLERS: ClassVar[dict[str, str]] = {
+        "text": "_add_text_block",
+        "thinking": "_add_thinking_block",
+        "tool_use": "_add_tool_use_block",
+        "web_search_tool_result": "_add_web_search_block",
+    }
+
+    def _convert_to_chat_response(
+        self,
+        response: Any,
+        *,
+        batch: bool = False,
+        tool_names: dict[str, str] | None = None,
+    ) -> ChatResponse:
         """Convert Anthropic response to ChatResponse format.
 
         Args:
             response: Anthropic API response
+            batch: Response came from the Message Batches API (discounted cost)
+            tool_names: OAuth tool-name mapping of the originating request;
+                defaults to the mapping of the most recent request
 
         Returns:
             AnthropicChatResponse with content blocks and streaming-compatible fields
         """
-        from amplifier_core.message_models import TextBlock
-        from amplifier_core.message_models import ThinkingBlock
-        from amplifier_core.message_models import ToolCall
-        from amplifier_core.message_models import ToolCallBlock
-        from amplifier_core.message_models import Usage
-
-        content_blocks = []
-        tool_calls = []
-        web_search_results: list[dict[str, Any]] = []
-        event_blocks: list[
-            TextContent | ThinkingContent | ToolCallContent | WebSearchContent
-        ] = []
-        text_accumulator: list[str] = []
-
+        parts = _ResponseParts(
+            tool_names=self._oauth_tool_names if tool_names is None else tool_names
+        )
         for block in response.content:
-            if block.type == "text":
-                content_blocks.append(TextBlock(text=block.text))
-                text_accumulator.append(block.text)
-                event_blocks.append(TextContent(text=block.text))
-            elif block.type == "thinking":
-                content_blocks.append(
-                    ThinkingBlock(
-                        thinking=block.thinking,
-                        signature=getattr(block, "signature", None),
-                        visibility="internal",
-                    )
-                )
-                event_blocks.append(ThinkingContent(text=block.thinking))
-                # NOTE: Do NOT add thinking to text_accumulator - it's internal process, not response content
-            elif block.type == "tool_use":
-                tool_name = self._oauth_tool_names.get(
-                    block.name.lower(), block.name
-                )
-                content_blocks.append(
-                    ToolCallBlock(id=block.id, name=tool_name, input=block.input)
-                )
-                tool_calls.append(
-                    ToolCall(id=block.id, name=tool_name, arguments=block.input)
-                )
-                event_blocks.append(
-                    ToolCallContent(id=block.id, name=tool_name, arguments=block.input)
-                )
-            elif block.type == "web_search_tool_result":
-                # Handle native web search results from Anthropic
-                # Extract citations from search results for observability
-                citations = self._extract_web_search_citations(block)
-                web_search_results.append(
-                    {
-                        "type": "web_search_tool_result",
-                        "tool_use_id": getattr(block, "tool_use_id", None),
-                        "citations": citations,
-                    }
-                )
-                # Add to event blocks for UI display
-                event_blocks.append(
-                    WebSearchContent(
-                        query=getattr(block, "query", ""),
-                        citations=citations,
-                    )
-                )
-                logger.debug(
-                    f"[PROVIDER] Web search returned {len(citations)} citations"
-                )
-            else:
+            handler_name = self._RESPONSE_BLOCK_HANDLERS.get(block.type)
+            if handler_name is None:
                 # Unknown block type (e.g. 'fallback' from Fable 5-class
                 # models) — skip gracefully rather than crashing.
                 logger.debug(
                     "[PROVIDER] Skipping unknown content block type: %s", block.type
                 )
                 continue
+            getattr(self, handler_name)(block, parts)
 
         # Build usage with named kernel fields + provider-native extras for
         # backward compatibility.  reasoning_tokens is intentionally None:
@@ -4022,26 +4786,33 @@ class AnthropicProvider:
             )
             or 0,
             speed=getattr(response.usage, "speed", None),
+            batch=batch,
         )
         usage = usage.model_copy(update={"cost_usd": cost})
         self._add_cost(cost)
 
-        combined_text = "\n\n".join(text_accumulator).strip()
+        combined_text = "\n\n".join(parts.text).strip()
 
         return AnthropicChatResponse(
-            content=content_blocks,
-            tool_calls=tool_calls if tool_calls else None,
+            content=parts.content,
+            tool_calls=parts.tool_calls if parts.tool_calls else None,
             usage=usage,
             finish_reason=response.stop_reason,
-            content_blocks=event_blocks if event_blocks else None,
+            content_blocks=parts.events if parts.events else None,
             text=combined_text or None,
-            web_search_results=web_search_results if web_search_results else None,
+            web_search_results=parts.web_search_results or None,
         )
 
     async def close(self) -> None:
-        """Close the underlying Anthropic client to prevent resource leaks."""
+        """Close the underlying Anthropic client to prevent resource leaks.
+
+        A client backed by the shared connection pool only releases its
+        reference; the pool closes once the last provider using it closes.
+        """
+        if self._pending_hook_tasks:
+            await asyncio.gather(*self._pending_hook_tasks, return_exceptions=True)
         if self._client is not None:
             try:
-                await asyncio.shield(self._client.close())
+                await asyncio.shield(self._close_client(self._client))
             except asyncio.CancelledError:
                 pass
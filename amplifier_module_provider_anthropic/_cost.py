@@ -196,6 +196,9 @@ _FAST_ELIGIBLE_MODELS: set[str] = {
     "claude-opus-4-8",
 }
 
+# Message Batches API requests are billed at 50% of standard rates.
+_BATCH_MULTIPLIER = Decimal("0.5")
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -210,6 +213,7 @@ def compute_cost(
     cache_read_input_tokens: int = 0,
     cache_creation_input_tokens: int = 0,
     speed: str | None = None,
+    batch: bool = False,
 ) -> Decimal | None:
     """Return the USD cost for an Anthropic API call as a :class:`~decimal.Decimal`.
 
@@ -231,6 +235,9 @@ def compute_cost(
     speed:
         When ``'fast'`` AND *model* is in :data:`_FAST_ELIGIBLE_MODELS` a 2x
         multiplier is applied; any other value leaves cost unchanged.
+    batch:
+        When ``True`` the call went through the Message Batches API and the
+        50% batch discount is applied.
 
     Returns
     -------
@@ -258,4 +265,7 @@ def compute_cost(
     if speed == "fast" and model in _FAST_ELIGIBLE_MODELS:
         cost *= 2
 
+    if batch:
+        cost *= _BATCH_MULTIPLIER
+
     return cost
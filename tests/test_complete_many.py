@@ -0,0 +1,119 @@
+"""Tests for complete_many(): concurrent fan-out over several requests.
+
+Verifies:
+- Results come back in input order
+- Requests overlap in flight (not awaited one by one)
+- max_concurrency bounds in-flight requests
+- A failing request yields its exception without cancelling the others
+"""
+
+import asyncio
+from typing import cast
+from unittest.mock import MagicMock
+
+from amplifier_core import ModuleCoordinator
+from amplifier_core.llm_errors import LLMError as KernelLLMError
+from amplifier_core.message_models import ChatRequest, ChatResponse, Message
+from amplifier_module_provider_anthropic import AnthropicProvider
+
+from tests._helpers import DummyResponse, FakeCoordinator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_provider() -> AnthropicProvider:
+    provider = AnthropicProvider(
+        api_key="test-key",
+        config={
+            "use_streaming": False,
+            "max_retries": 0,
+            "max_concurrent_requests": 0,
+        },
+    )
+    provider.coordinator = cast(ModuleCoordinator, FakeCoordinator())
+    return provider
+
+
+def _request(text: str) -> ChatRequest:
+    return ChatRequest(messages=[Message(role="user", content=text)])
+
+
+class _TrackingCreate:
+    """Fake messages.create that records peak in-flight calls.
+
+    Each call is held until ``gate`` calls are in flight at once (or a short
+    timeout passes), so the peak does not depend on scheduler timing.
+    """
+
+    def __init__(self, fail_on: str | None = None, gate: int = 1) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.fail_on = fail_on
+        self.gate = gate
+        self.open = asyncio.Event()
+
+    async def __call__(self, **params):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.in_flight >= self.gate:
+                self.open.set()
+            try:
+                await asyncio.wait_for(self.open.wait(), timeout=0.2)
+            except asyncio.TimeoutError:
+                pass
+            content = params["messages"][-1]["content"]
+            text = content if isinstance(content, str) else content[-1]["text"]
+            if text == self.fail_on:
+                raise RuntimeError(f"boom: {text}")
+            raw = MagicMock()
+            raw.parse.return_value = DummyResponse(
+                content=[MagicMock(type="text", text=text)]
+            )
+            raw.headers = {}
+            return raw
+        finally:
+            self.in_flight -= 1
+
+
+def _run(provider: AnthropicProvider, create: _TrackingCreate, texts, **kwargs):
+    provider.client.messages.with_raw_response.create = create
+    return asyncio.run(provider.complete_many([_request(t) for t in texts], **kwargs))
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestCompleteMany:
+    def test_results_preserve_input_order(self):
+        texts = ["a", "b", "c", "d"]
+        results = _run(_make_provider(), _TrackingCreate(), texts)
+
+        assert all(isinstance(r, ChatResponse) for r in results)
+        assert [r.content[0].text for r in results] == texts
+
+    def test_requests_run_concurrently(self):
+        create = _TrackingCreate(gate=4)
+        _run(_make_provider(), create, ["a", "b", "c", "d"])
+        assert create.peak == 4
+
+    def test_max_concurrency_bounds_in_flight(self):
+        create = _TrackingCreate(gate=3)
+        _run(_make_provider(), create, list("abcdef"), max_concurrency=2)
+        assert create.peak == 2
+
+    def test_failure_is_returned_not_raised(self):
+        create = _TrackingCreate(fail_on="b")
+        results = _run(_make_provider(), create, ["a", "b", "c"])
+
+        assert isinstance(results[0], ChatResponse)
+        assert isinstance(results[1], KernelLLMError)
+        assert isinstance(results[2], ChatResponse)
+
+    def test_empty_input(self):
+        assert _run(_make_provider(), _TrackingCreate(), []) == []
@@ -0,0 +1,65 @@
+"""Tests for the process-wide shared httpx connection pool."""
+
+import pytest
+from anthropic import DefaultAsyncHttpxClient
+
+import amplifier_module_provider_anthropic as anthropic_module
+from amplifier_module_provider_anthropic import AnthropicProvider
+
+
+@pytest.mark.asyncio
+async def test_providers_on_same_loop_share_http_client():
+    """Clients created inside one event loop reuse a single httpx pool."""
+    first = AnthropicProvider(api_key="key-one")
+    second = AnthropicProvider(api_key="key-two")
+
+    assert first.client._client is second.client._client
+
+    await first.close()
+    await second.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_closes_only_after_last_provider_closes():
+    first = AnthropicProvider(api_key="key-one")
+    second = AnthropicProvider(api_key="key-two")
+    shared = first.client._client
+    second.client  # noqa: B018 - take a reference on the pool
+
+    await first.close()
+    assert not shared.is_closed
+
+    await second.close()
+    assert shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_double_close_does_not_close_pool_held_by_others():
+    first = AnthropicProvider(api_key="key-one")
+    second = AnthropicProvider(api_key="key-two")
+    shared = first.client._client
+    second.client  # noqa: B018 - take a reference on the pool
+
+    await first.close()
+    await first.close()
+    assert not shared.is_closed
+
+    await second.close()
+    assert shared.is_closed
+
+
+def test_pool_size_config_is_parsed():
+    assert AnthropicProvider(api_key="k", config={"pool_size": "7"})._pool_size == 7
+    assert AnthropicProvider(api_key="k", config={"pool_size": "x"})._pool_size == 100
+
+
+def test_client_outside_event_loop_owns_private_http_client():
+    """Without a running loop the provider uses a private, unshared httpx client."""
+    provider = AnthropicProvider(api_key="test-key")
+    http_client = provider.client._client
+
+    assert provider._http_pool_lease is None
+    assert isinstance(http_client, DefaultAsyncHttpxClient)
+    assert all(
+        pool.client is not http_client for pool in anthropic_module._http_pools.values()
+    )
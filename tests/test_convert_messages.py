@@ -0,0 +1,58 @@
+"""Tests for _convert_messages() accepting Message objects directly.
+
+Verifies that passing Message objects yields exactly the same Anthropic
+payload as passing their model_dump() form, for every role and for
+extras (tool_calls, thinking_block) and structured content blocks.
+"""
+
+from amplifier_core.message_models import ImageBlock, Message, TextBlock
+from amplifier_module_provider_anthropic import AnthropicProvider
+
+
+def _conversation() -> list[Message]:
+    return [
+        Message(
+            role="user",
+            content=[
+                TextBlock(text="What is in this image?"),
+                ImageBlock(
+                    source={"type": "base64", "media_type": "image/png", "data": "AA=="}
+                ),
+            ],
+        ),
+        Message(
+            role="assistant",
+            content="Let me check.",
+            tool_calls=[{"id": "call_1", "tool": "grep", "arguments": {"q": "x"}}],
+            thinking_block={
+                "type": "thinking",
+                "thinking": "hmm",
+                "signature": "sig",
+                "visibility": "internal",
+            },
+        ),
+        Message(role="tool", content="found it", tool_call_id="call_1"),
+        Message(role="assistant", content=[TextBlock(text="Done.")]),
+        Message(role="user", content="Thanks"),
+    ]
+
+
+class TestConvertMessagesFromModels:
+    def test_matches_model_dump_path(self):
+        provider = AnthropicProvider(api_key="test-key")
+        conversation = _conversation()
+
+        from_models = provider._convert_messages(conversation)
+        from_dicts = provider._convert_messages([m.model_dump() for m in conversation])
+
+        assert from_models == from_dicts
+
+    def test_string_content_passed_through(self):
+        message = Message(role="user", content="Hello")
+        data = AnthropicProvider._message_as_dict(message)
+
+        assert data["content"] is message.content
+
+    def test_dicts_are_returned_unchanged(self):
+        raw = {"role": "user", "content": "Hello"}
+        assert AnthropicProvider._message_as_dict(raw) is raw
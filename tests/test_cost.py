@@ -385,3 +385,25 @@ def test_sonnet_5_cache_write_cost():
     """claude-sonnet-5: 1M cache-write -> $3.75 (125% of input)."""
     result = compute_cost("claude-sonnet-5", cache_creation_input_tokens=1_000_000)
     assert result == Decimal("3.75"), f"Expected Decimal('3.75'), got {result!r}"
+
+
+# ---------------------------------------------------------------------------
+# (s) Message Batches API: 50% of standard rates
+# ---------------------------------------------------------------------------
+def test_batch_halves_cost():
+    """batch=True on claude-opus-4-8: 1M input -> $2.50 instead of $5.00"""
+    result = compute_cost("claude-opus-4-8", input_tokens=1_000_000, batch=True)
+    assert result == Decimal("2.50"), f"Expected Decimal('2.50'), got {result!r}"
+
+
+def test_convert_applies_batch_discount():
+    """_convert_to_chat_response(batch=True) stamps the discounted cost."""
+    provider = _make_provider()
+    response = _make_response(
+        model="claude-opus-4-8", input_tokens=1_000_000, output_tokens=0
+    )
+    result = provider._convert_to_chat_response(response, batch=True)
+    assert result.usage is not None
+    assert result.usage.cost_usd == Decimal("2.50"), (
+        f"Expected Decimal('2.50') for a batch response, got {result.usage.cost_usd!r}"
+    )
@@ -31,7 +31,7 @@ from amplifier_core.llm_errors import (
 from amplifier_core.message_models import ChatRequest, Message
 from amplifier_module_provider_anthropic import AnthropicProvider
 
-from tests._helpers import FakeCoordinator
+from tests._helpers import DummyResponse, FakeCoordinator
 
 
 # ---------------------------------------------------------------------------
@@ -256,6 +256,26 @@ class TestAPIStatusErrorTranslation:
 
         assert exc_info.value.status_code == 503
 
+    def test_408_translates_to_retryable_timeout(self):
+        provider = _make_provider()
+        mock_response = MagicMock()
+        mock_response.status_code = 408
+        mock_response.headers = {}
+        sdk_error = anthropic.APIStatusError(
+            "request timeout", response=mock_response, body=None
+        )
+        provider.client.messages.with_raw_response.create = AsyncMock(
+            side_effect=sdk_error
+        )
+
+        with pytest.raises(KernelLLMTimeoutError) as exc_info:
+            asyncio.run(provider.complete(_simple_request()))
+
+        e = exc_info.value
+        assert e.status_code == 408
+        assert e.retryable is True
+        assert e.__cause__ is sdk_error
+
 
 class TestTimeoutErrorTranslation:
     def test_asyncio_timeout_translates(self):
@@ -271,6 +291,35 @@ class TestTimeoutErrorTranslation:
         assert e.provider == "anthropic"
         assert e.retryable is True
 
+    def test_sdk_timeout_translates(self):
+        provider = _make_provider()
+        original = anthropic.APITimeoutError(request=MagicMock())
+        provider.client.messages.with_raw_response.create = AsyncMock(
+            side_effect=original
+        )
+
+        with pytest.raises(KernelLLMTimeoutError) as exc_info:
+            asyncio.run(provider.complete(_simple_request()))
+
+        assert exc_info.value.retryable is True
+        assert exc_info.value.__cause__ is original
+
+    def test_timeout_passed_to_sdk_call(self):
+        """Non-streaming calls use the SDK's socket-level timeout, not wait_for."""
+        provider = _make_provider()
+        raw = MagicMock()
+        raw.parse.return_value = DummyResponse()
+        raw.headers = {}
+        mock_create = AsyncMock(return_value=raw)
+        provider.client.messages.with_raw_response.create = mock_create
+
+        asyncio.run(provider.complete(_simple_request()))
+        assert mock_create.call_args.kwargs["timeout"] == provider.timeout
+
+        request = ChatRequest(messages=[Message(role="user", content="Hi")], timeout=5)
+        asyncio.run(provider.complete(request))
+        assert mock_create.call_args.kwargs["timeout"] == 5
+
 
 class TestGenericExceptionTranslation:
     def test_unknown_exception_translates_to_llm_error(self):
@@ -8,6 +8,7 @@ Covers:
   (e) usage.iterations absent does not crash
   (f) usage.iterations present does not crash
   (g) Unknown 'fallback' content block is skipped without crashing
+  (h) Block handlers are looked up on the instance, so subclass overrides apply
 """
 
 from unittest.mock import MagicMock
@@ -154,3 +155,28 @@ def test_fallback_content_block_skipped():
     response = _make_response(content_blocks=[fallback_block, text_block])
     result = provider._convert_to_chat_response(response)
     assert result is not None
+
+
+# ---------------------------------------------------------------------------
+# (h) Block handlers resolve on the instance — subclass overrides apply
+# ---------------------------------------------------------------------------
+def test_subclass_block_handler_override_is_used():
+    """A subclass overriding _add_text_block must see its override called."""
+    seen: list[str] = []
+
+    class _Provider(AnthropicProvider):
+        def _add_text_block(self, block, parts) -> None:
+            seen.append(block.text)
+            super()._add_text_block(block, parts)
+
+    provider = _Provider(api_key="test-key", config={"max_retries": 0})
+    text_block = MagicMock()
+    text_block.type = "text"
+    text_block.text = "Hello"
+
+    result = provider._convert_to_chat_response(
+        _make_response(content_blocks=[text_block])
+    )
+
+    assert seen == ["Hello"]
+    assert result.text == "Hello"
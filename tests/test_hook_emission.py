@@ -0,0 +1,191 @@
+"""Tests for non-blocking llm:request emission.
+
+Verifies:
+- The API call starts without waiting for llm:request handlers
+- llm:request is still delivered before llm:response
+- Pre-call provider:concurrency events are queued behind llm:request, not
+  emitted ahead of it
+- On the streaming path, llm:request precedes every llm:stream_* event
+- A failing llm:request handler does not fail the completion
+"""
+
+import asyncio
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+from amplifier_core import ModuleCoordinator
+from amplifier_core.message_models import ChatRequest, Message
+from amplifier_module_provider_anthropic import AnthropicProvider
+from anthropic.types import (
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+    RawContentBlockStopEvent,
+    TextBlock,
+    TextDelta,
+)
+
+from tests._helpers import DummyResponse, FakeCoordinator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _SlowRequestHooks:
+    """Hooks whose llm:request handler blocks until the API call has started."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.events: list[str] = []
+        self.api_called = asyncio.Event()
+        self.fail = fail
+
+    async def emit(self, name: str, payload: dict) -> None:
+        if name == "llm:request":
+            await self.api_called.wait()
+            if self.fail:
+                raise RuntimeError("handler failed")
+        if name.startswith("llm:") or name == "provider:concurrency":
+            self.events.append(name)
+
+
+class _AsyncRequestHooks:
+    """Hooks whose llm:request handler does async I/O before recording."""
+
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    async def emit(self, name: str, payload: dict) -> None:
+        if name == "llm:request":
+            await asyncio.sleep(0.01)
+        if name.startswith("llm:") or name == "provider:concurrency":
+            self.events.append(name)
+
+
+class _FakeStream:
+    def __init__(self, events, final) -> None:
+        self._events = events
+        self._final = final
+        self.response = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def __aiter__(self):
+        for event in self._events:
+            yield event
+
+    async def get_final_message(self):
+        return self._final
+
+
+def _make_provider(hooks, use_streaming: bool = False) -> AnthropicProvider:
+    provider = AnthropicProvider(
+        api_key="test-key",
+        config={"use_streaming": use_streaming, "max_retries": 0},
+    )
+    coordinator = FakeCoordinator()
+    coordinator.hooks = hooks
+    provider.coordinator = cast(ModuleCoordinator, coordinator)
+    return provider
+
+
+def _install_create(provider: AnthropicProvider, hooks) -> AsyncMock:
+    raw = MagicMock()
+    raw.parse.return_value = DummyResponse()
+    raw.headers = {}
+
+    async def create(**params):
+        hooks.api_called.set()
+        return raw
+
+    mock_create = AsyncMock(side_effect=create)
+    provider.client.messages.with_raw_response.create = mock_create
+    return mock_create
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestRequestEventIsNonBlocking:
+    def test_api_call_does_not_wait_for_request_handlers(self):
+        # If llm:request were awaited inline this would deadlock (and time out).
+        async def run():
+            hooks = _SlowRequestHooks()
+            provider = _make_provider(hooks)
+            _install_create(provider, hooks)
+            request = ChatRequest(messages=[Message(role="user", content="Hi")])
+            await asyncio.wait_for(provider.complete(request), timeout=5)
+            return hooks
+
+        hooks = asyncio.run(run())
+        assert hooks.events == ["llm:request", "provider:concurrency", "llm:response"]
+
+    def test_failing_request_handler_does_not_fail_completion(self):
+        async def run():
+            hooks = _SlowRequestHooks(fail=True)
+            provider = _make_provider(hooks)
+            _install_create(provider, hooks)
+            request = ChatRequest(messages=[Message(role="user", content="Hi")])
+            return await provider.complete(request), hooks
+
+        response, hooks = asyncio.run(run())
+        assert response is not None
+        assert hooks.events == ["provider:concurrency", "llm:response"]
+
+    def test_request_event_precedes_stream_events(self):
+        async def run():
+            hooks = _AsyncRequestHooks()
+            provider = _make_provider(hooks, use_streaming=True)
+            events = [
+                RawContentBlockStartEvent(
+                    type="content_block_start",
+                    index=0,
+                    content_block=TextBlock(type="text", text=""),
+                ),
+                RawContentBlockDeltaEvent(
+                    type="content_block_delta",
+                    index=0,
+                    delta=TextDelta(type="text_delta", text="Hello"),
+                ),
+                RawContentBlockStopEvent(type="content_block_stop", index=0),
+            ]
+            final = DummyResponse(content=[MagicMock(type="text", text="Hello")])
+            provider.client.messages.stream = MagicMock(
+                return_value=_FakeStream(events, final)
+            )
+            request = ChatRequest(messages=[Message(role="user", content="Hi")])
+            await provider.complete(request)
+            return hooks
+
+        hooks = asyncio.run(run())
+        assert hooks.events == [
+            "llm:request",
+            "provider:concurrency",
+            "llm:stream_block_start",
+            "llm:stream_block_delta",
+            "llm:stream_block_end",
+            "llm:response",
+        ]
+
+    def test_concurrency_event_follows_request_event(self):
+        async def run():
+            hooks = _AsyncRequestHooks()
+            provider = _make_provider(hooks)
+            raw = MagicMock()
+            raw.parse.return_value = DummyResponse()
+            raw.headers = {}
+            provider.client.messages.with_raw_response.create = AsyncMock(
+                return_value=raw
+            )
+            request = ChatRequest(messages=[Message(role="user", content="Hi")])
+            await provider.complete(request)
+            return hooks
+
+        hooks = asyncio.run(run())
+        assert hooks.events == ["llm:request", "provider:concurrency", "llm:response"]
@@ -0,0 +1,341 @@
+"""Tests for complete_batch(): Message Batches API backend.
+
+Verifies:
+- Requests are submitted with the same params complete() would send
+- The batch is polled until processing ends
+- Results are returned in input order regardless of result order
+- Errored / expired entries become KernelLLMError values
+- Missing tool results are repaired as in complete(); a request that still
+  fails to build becomes an error at its index without failing the batch
+- Beta headers are hoisted from per-request params onto the batch call
+- Batch API errors are retried and surface as kernel errors; once the batch
+  is submitted the error carries its batch_id
+- Cost is reported at the discounted batch rate
+- OAuth tool names are mapped back per request, not from the last request
+"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import cast
+from unittest.mock import AsyncMock, MagicMock
+
+import anthropic
+import pytest
+from amplifier_core import ModuleCoordinator
+from amplifier_core.llm_errors import (
+    InvalidRequestError as KernelInvalidRequestError,
+    LLMError as KernelLLMError,
+    ProviderUnavailableError as KernelProviderUnavailableError,
+    RateLimitError as KernelRateLimitError,
+)
+from amplifier_anthropic_oauth.auth import AnthropicAuth
+from amplifier_core.message_models import (
+    ChatRequest,
+    ChatResponse,
+    Message,
+    ToolCallBlock,
+    ToolSpec,
+)
+from amplifier_module_provider_anthropic import AnthropicProvider
+from amplifier_module_provider_anthropic._cost import compute_cost
+
+from tests._helpers import DummyResponse, FakeCoordinator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_provider(max_retries: int = 0) -> AnthropicProvider:
+    provider = AnthropicProvider(
+        api_key="test-key",
+        config={
+            "use_streaming": False,
+            "max_retries": max_retries,
+            "min_retry_delay": 0.01,
+            "retry_jitter": False,
+        },
+    )
+    provider.coordinator = cast(ModuleCoordinator, FakeCoordinator())
+    return provider
+
+
+def _request(text: str, tools: list[ToolSpec] | None = None) -> ChatRequest:
+    return ChatRequest(messages=[Message(role="user", content=text)], tools=tools)
+
+
+def _tool(name: str) -> ToolSpec:
+    return ToolSpec(name=name, parameters={"type": "object", "properties": {}})
+
+
+def _tool_call(call_id: str) -> Message:
+    return Message(
+        role="assistant", content=[ToolCallBlock(id=call_id, name="grep", input={})]
+    )
+
+
+def _tool_use(custom_id: str, name: str):
+    block = SimpleNamespace(type="tool_use", id="toolu_1", name=name, input={})
+    return SimpleNamespace(
+        custom_id=custom_id,
+        result=SimpleNamespace(type="succeeded", message=DummyResponse([block])),
+    )
+
+
+def _succeeded(custom_id: str, text: str):
+    message = DummyResponse(content=[MagicMock(type="text", text=text)])
+    return SimpleNamespace(
+        custom_id=custom_id,
+        result=SimpleNamespace(type="succeeded", message=message),
+    )
+
+
+def _errored(custom_id: str, error_type: str, message: str):
+    error = SimpleNamespace(type=error_type, message=message)
+    return SimpleNamespace(
+        custom_id=custom_id,
+        result=SimpleNamespace(type="errored", error=SimpleNamespace(error=error)),
+    )
+
+
+def _expired(custom_id: str):
+    return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="expired"))
+
+
+def _sdk_error(cls: type[anthropic.APIStatusError], status_code: int):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    return cls("sdk error", response=response, body=None)
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+def _install_batches(provider: AnthropicProvider, entries, polls: int = 1):
+    batches = MagicMock()
+    batches.create = AsyncMock(
+        return_value=SimpleNamespace(id="batch_1", processing_status="in_progress")
+    )
+    statuses = ["in_progress"] * (polls - 1) + ["ended"]
+    batches.retrieve = AsyncMock(
+        side_effect=[
+            SimpleNamespace(id="batch_1", processing_status=status)
+            for status in statuses
+        ]
+    )
+    batches.results = AsyncMock(return_value=_aiter(entries))
+    provider.client.messages.batches = batches
+    return batches
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestCompleteBatch:
+    def test_results_ordered_by_custom_id(self):
+        provider = _make_provider()
+        batches = _install_batches(
+            provider, [_succeeded("1", "second"), _succeeded("0", "first")]
+        )
+
+        results = asyncio.run(
+            provider.complete_batch([_request("one"), _request("two")], poll_interval=0)
+        )
+
+        assert [r.content[0].text for r in results] == ["first", "second"]
+        assert all(isinstance(r, ChatResponse) for r in results)
+        batches.results.assert_awaited_once_with("batch_1")
+
+    def test_submits_same_params_as_complete(self):
+        provider = _make_provider()
+        batches = _install_batches(provider, [_succeeded("0", "ok")])
+
+        asyncio.run(provider.complete_batch([_request("Hello")], poll_interval=0))
+
+        submitted = batches.create.call_args.kwargs["requests"]
+        assert submitted[0]["custom_id"] == "0"
+        params = submitted[0]["params"]
+        assert params["model"] == provider.default_model
+        assert params["messages"][-1]["content"][-1]["text"] == "Hello"
+        assert "extra_headers" not in params
+
+    def test_polls_until_ended(self):
+        provider = _make_provider()
+        batches = _install_batches(provider, [_succeeded("0", "ok")], polls=3)
+
+        asyncio.run(provider.complete_batch([_request("Hello")], poll_interval=0))
+
+        assert batches.retrieve.await_count == 3
+
+    def test_failed_entries_become_errors(self):
+        provider = _make_provider()
+        _install_batches(
+            provider,
+            [
+                _succeeded("0", "ok"),
+                _errored("1", "invalid_request_error", "bad params"),
+                _errored("2", "overloaded_error", "busy"),
+                _expired("3"),
+            ],
+        )
+
+        results = asyncio.run(
+            provider.complete_batch(
+                [_request(str(i)) for i in range(5)], poll_interval=0
+            )
+        )
+
+        assert isinstance(results[0], ChatResponse)
+        assert isinstance(results[1], KernelInvalidRequestError)
+        assert str(results[1]) == "bad params"
+        assert type(results[2]) is KernelLLMError
+        assert isinstance(results[3], KernelLLMError) and results[3].retryable
+        assert isinstance(results[4], KernelLLMError)  # missing from results
+
+    def test_malformed_request_does_not_fail_batch(self):
+        provider = _make_provider()
+        batches = _install_batches(
+            provider, [_succeeded("0", "ok"), _succeeded("1", "repaired")]
+        )
+        unanswered = ChatRequest(
+            messages=[Message(role="user", content="Search"), _tool_call("call_1")]
+        )
+        # A reused tool ID after its result cannot be repaired.
+        duplicate_id = ChatRequest(
+            messages=[
+                _tool_call("call_2"),
+                Message(role="tool", tool_call_id="call_2", content="ok"),
+                _tool_call("call_2"),
+            ]
+        )
+
+        results = asyncio.run(
+            provider.complete_batch(
+                [_request("Hello"), unanswered, duplicate_id], poll_interval=0
+            )
+        )
+
+        submitted = batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in submitted] == ["0", "1"]
+        assert submitted[1]["params"]["messages"][-1]["content"][0]["type"] == (
+            "tool_result"
+        )
+        assert isinstance(results[0], ChatResponse)
+        assert isinstance(results[1], ChatResponse)
+        assert isinstance(results[2], KernelInvalidRequestError)
+
+    def test_all_requests_malformed_makes_no_call(self):
+        provider = _make_provider()
+        batches = _install_batches(provider, [])
+        request = ChatRequest(
+            messages=[
+                _tool_call("call_1"),
+                Message(role="tool", tool_call_id="call_1", content="ok"),
+                _tool_call("call_1"),
+            ]
+        )
+
+        (result,) = asyncio.run(provider.complete_batch([request], poll_interval=0))
+
+        assert isinstance(result, KernelInvalidRequestError)
+        batches.create.assert_not_called()
+
+    def test_batch_api_errors_are_retried(self):
+        provider = _make_provider(max_retries=2)
+        batches = _install_batches(provider, [_succeeded("0", "ok")])
+        batches.create.side_effect = [
+            _sdk_error(anthropic.RateLimitError, 429),
+            SimpleNamespace(id="batch_1", processing_status="in_progress"),
+        ]
+        batches.retrieve.side_effect = [
+            _sdk_error(anthropic.InternalServerError, 500),
+            SimpleNamespace(id="batch_1", processing_status="ended"),
+        ]
+
+        (result,) = asyncio.run(
+            provider.complete_batch([_request("Hello")], poll_interval=0)
+        )
+
+        assert isinstance(result, ChatResponse)
+        assert batches.create.await_count == 2
+        assert batches.retrieve.await_count == 2
+
+    def test_submit_failure_raises_kernel_error(self):
+        provider = _make_provider()
+        batches = _install_batches(provider, [])
+        batches.create.side_effect = _sdk_error(anthropic.RateLimitError, 429)
+
+        with pytest.raises(KernelRateLimitError) as exc_info:
+            asyncio.run(provider.complete_batch([_request("Hello")], poll_interval=0))
+
+        assert not hasattr(exc_info.value, "batch_id")
+
+    def test_poll_failure_carries_batch_id(self):
+        provider = _make_provider()
+        batches = _install_batches(provider, [])
+        batches.retrieve.side_effect = _sdk_error(anthropic.InternalServerError, 500)
+
+        with pytest.raises(KernelProviderUnavailableError) as exc_info:
+            asyncio.run(provider.complete_batch([_request("Hello")], poll_interval=0))
+
+        assert exc_info.value.batch_id == "batch_1"  # pyright: ignore[reportAttributeAccessIssue]
+
+    def test_beta_headers_sent_on_batch(self):
+        provider = _make_provider()
+        provider.config["speed"] = "fast"
+        batches = _install_batches(provider, [_succeeded("0", "ok")])
+
+        asyncio.run(
+            provider.complete_batch(
+                [_request("Hello")], poll_interval=0, model="claude-opus-4-8"
+            )
+        )
+
+        headers = batches.create.call_args.kwargs["extra_headers"]
+        assert headers is not None and "anthropic-beta" in headers
+
+    def test_empty_input_makes_no_call(self):
+        provider = _make_provider()
+        batches = _install_batches(provider, [])
+
+        assert asyncio.run(provider.complete_batch([])) == []
+        batches.create.assert_not_called()
+
+    def test_cost_uses_batch_discount(self):
+        provider = _make_provider()
+        _install_batches(provider, [_succeeded("0", "ok")])
+
+        (result,) = asyncio.run(
+            provider.complete_batch([_request("Hello")], poll_interval=0)
+        )
+
+        full_price = compute_cost(
+            "claude-sonnet-4-5-20250929", input_tokens=10, output_tokens=5
+        )
+        assert full_price is not None
+        assert result.usage.cost_usd == full_price * Decimal("0.5")
+
+    def test_oauth_tool_names_mapped_per_request(self):
+        provider = AnthropicProvider(
+            "sk-ant-oat-test",
+            config={"use_streaming": False, "max_retries": 0},
+            initial_auth=AnthropicAuth("sk-ant-oat-test", oauth=True),
+        )
+        provider.coordinator = cast(ModuleCoordinator, FakeCoordinator())
+        _install_batches(provider, [_tool_use("0", "Read"), _tool_use("1", "Grep")])
+
+        results = asyncio.run(
+            provider.complete_batch(
+                [_request("a", [_tool("read")]), _request("b", [_tool("grep")])],
+                poll_interval=0,
+            )
+        )
+
+        assert [r.tool_calls[0].name for r in results] == ["read", "grep"]
@@ -0,0 +1,146 @@
+"""Tests for prompt-caching breakpoints on request params.
+
+Verifies:
+- The last developer context message gets its own cache breakpoint
+- No context breakpoint when context is the only content (last-message
+  breakpoint already covers it)
+- The four-breakpoint API limit is never exceeded (OAuth identity block)
+- enable_prompt_caching=False emits no cache_control anywhere
+- System messages combine into one cached text block, skipping non-text ones
+"""
+
+import asyncio
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+from amplifier_core import ModuleCoordinator
+from amplifier_core.message_models import ChatRequest, Message, ToolSpec
+from amplifier_anthropic_oauth.auth import AnthropicAuth
+from amplifier_module_provider_anthropic import AnthropicProvider
+
+from tests._helpers import DummyResponse, FakeCoordinator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_provider(
+    config: dict[str, Any] | None = None,
+    auth: AnthropicAuth | None = None,
+) -> AnthropicProvider:
+    provider = AnthropicProvider(
+        api_key=auth.token if auth else "test-key",
+        config={"use_streaming": False, "max_retries": 0, **(config or {})},
+        initial_auth=auth,
+    )
+    provider.coordinator = cast(ModuleCoordinator, FakeCoordinator())
+    return provider
+
+
+def _make_raw_mock() -> MagicMock:
+    raw = MagicMock()
+    raw.parse.return_value = DummyResponse()
+    raw.headers = {}
+    return raw
+
+
+def _request(*, with_tools: bool = False, conversation: bool = True) -> ChatRequest:
+    messages = [
+        Message(role="system", content="You are helpful."),
+        Message(role="developer", content="file one"),
+        Message(role="developer", content="file two"),
+    ]
+    if conversation:
+        messages.append(Message(role="user", content="Hello"))
+    tools = (
+        [ToolSpec(name="probe", description="probe", parameters={"type": "object"})]
+        if with_tools
+        else None
+    )
+    return ChatRequest(messages=messages, tools=tools)
+
+
+def _send(provider: AnthropicProvider, request: ChatRequest) -> dict[str, Any]:
+    mock_create = AsyncMock(return_value=_make_raw_mock())
+    provider.client.messages.with_raw_response.create = mock_create
+    asyncio.run(provider.complete(request))
+    _, kwargs = mock_create.call_args
+    return kwargs
+
+
+def _breakpoints(params: dict[str, Any]) -> int:
+    return AnthropicProvider._count_cache_breakpoints(params)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestContextCacheBreakpoint:
+    def test_last_context_message_gets_breakpoint(self):
+        params = _send(_make_provider(), _request())
+        messages = params["messages"]
+
+        assert messages[0]["content"] == "<context_file>\nfile one\n</context_file>"
+        assert messages[1]["content"] == [
+            {
+                "type": "text",
+                "text": "<context_file>\nfile two\n</context_file>",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    def test_context_only_request_has_single_message_breakpoint(self):
+        params = _send(_make_provider(), _request(conversation=False))
+        messages = params["messages"]
+
+        assert messages[0]["content"] == "<context_file>\nfile one\n</context_file>"
+        assert messages[-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_breakpoints_within_api_limit_with_tools(self):
+        params = _send(_make_provider(), _request(with_tools=True))
+        assert _breakpoints(params) == 4
+
+    def test_oauth_identity_leaves_no_slot_for_context(self):
+        auth = AnthropicAuth("sk-ant-oat-cache-test", oauth=True)
+        params = _send(_make_provider(auth=auth), _request(with_tools=True))
+
+        assert _breakpoints(params) == 4
+        assert isinstance(params["messages"][1]["content"], str)
+
+    def test_caching_disabled_emits_no_breakpoints(self):
+        provider = _make_provider({"enable_prompt_caching": False})
+        params = _send(provider, _request(with_tools=True))
+        assert _breakpoints(params) == 0
+
+
+class TestSystemBlock:
+    def test_non_text_and_empty_system_messages_are_skipped(self):
+        provider = _make_provider()
+        blocks = provider._format_system_with_cache(
+            [
+                Message(role="system", content=""),
+                Message(role="system", content="first"),
+                Message(role="system", content=[{"type": "text", "text": "x"}]),
+                Message(role="system", content="second"),
+            ]
+        )
+
+        assert blocks == [
+            {
+                "type": "text",
+                "text": "first\n\nsecond",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    def test_no_text_returns_none(self):
+        provider = _make_provider()
+        assert provider._format_system_with_cache([]) is None
+        assert (
+            provider._format_system_with_cache([Message(role="system", content="")])
+            is None
+        )
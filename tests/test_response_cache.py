@@ -0,0 +1,140 @@
+"""Tests for the opt-in in-memory response cache.
+
+Verifies:
+- Disabled by default
+- Identical temperature=0 requests hit the cache (one API call)
+- Non-deterministic requests are never cached
+- Hits return independent copies and emit provider:response_cache_hit
+- Hits report zero usage/cost and are marked in metadata
+- The cache is bounded (LRU eviction)
+"""
+
+import asyncio
+from decimal import Decimal
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+from amplifier_core import ModuleCoordinator
+from amplifier_core.message_models import ChatRequest, Message
+from amplifier_module_provider_anthropic import (
+    PROVIDER_RESPONSE_CACHE_HIT,
+    AnthropicProvider,
+)
+
+from tests._helpers import DummyResponse, FakeCoordinator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_provider(config: dict[str, Any] | None = None) -> AnthropicProvider:
+    provider = AnthropicProvider(
+        api_key="test-key",
+        config={
+            "use_streaming": False,
+            "max_retries": 0,
+            "response_cache": True,
+            "temperature": 0,
+            **(config or {}),
+        },
+    )
+    provider.coordinator = cast(ModuleCoordinator, FakeCoordinator())
+    return provider
+
+
+def _install_create(provider: AnthropicProvider) -> AsyncMock:
+    raw = MagicMock()
+    raw.parse.return_value = DummyResponse(
+        content=[MagicMock(type="text", text="cached answer")]
+    )
+    raw.headers = {}
+    mock_create = AsyncMock(return_value=raw)
+    provider.client.messages.with_raw_response.create = mock_create
+    return mock_create
+
+
+def _request(text: str = "Hello") -> ChatRequest:
+    return ChatRequest(messages=[Message(role="user", content=text)])
+
+
+def _complete_all(provider: AnthropicProvider, requests: list[ChatRequest]):
+    async def run():
+        return [await provider.complete(r) for r in requests]
+
+    return asyncio.run(run())
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    def test_disabled_by_default(self):
+        provider = AnthropicProvider(api_key="test-key")
+        assert provider._response_cache_enabled is False
+
+    def test_identical_deterministic_requests_hit_cache(self):
+        provider = _make_provider()
+        mock_create = _install_create(provider)
+
+        first, second = _complete_all(provider, [_request(), _request()])
+
+        assert mock_create.await_count == 1
+        assert second.content[0].text == first.content[0].text
+        hooks = provider.coordinator.hooks  # type: ignore[attr-defined]
+        assert hooks.emitted_names().count(PROVIDER_RESPONSE_CACHE_HIT) == 1
+
+    def test_different_requests_miss(self):
+        provider = _make_provider()
+        mock_create = _install_create(provider)
+
+        _complete_all(provider, [_request("a"), _request("b")])
+
+        assert mock_create.await_count == 2
+
+    def test_nonzero_temperature_not_cached(self):
+        provider = _make_provider({"temperature": 0.7})
+        mock_create = _install_create(provider)
+
+        _complete_all(provider, [_request(), _request()])
+
+        assert mock_create.await_count == 2
+        assert not provider._response_cache
+
+    def test_hits_are_independent_copies(self):
+        provider = _make_provider()
+        _install_create(provider)
+
+        first, second = _complete_all(provider, [_request(), _request()])
+        second.content[0].text = "mutated"
+        (third,) = _complete_all(provider, [_request()])
+
+        assert first is not second
+        assert third.content[0].text == "cached answer"
+
+    def test_hits_report_zero_usage(self):
+        provider = _make_provider()
+        _install_create(provider)
+
+        first, second = _complete_all(provider, [_request(), _request()])
+
+        assert first.usage.input_tokens == 10
+        assert not (first.metadata or {}).get("response_cache_hit")
+        assert second.usage.input_tokens == 0
+        assert second.usage.output_tokens == 0
+        assert second.usage.total_tokens == 0
+        assert second.usage.cost_usd == Decimal("0")
+        assert second.metadata["response_cache_hit"] is True
+
+    def test_cache_is_bounded(self):
+        provider = _make_provider({"response_cache_size": 2})
+        mock_create = _install_create(provider)
+
+        _complete_all(provider, [_request("a"), _request("b"), _request("c")])
+        assert len(provider._response_cache) == 2
+
+        _complete_all(provider, [_request("a")])
+        assert mock_create.await_count == 4
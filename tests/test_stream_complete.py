@@ -0,0 +1,140 @@
+"""Tests for stream_complete(): incremental deltas then the final response.
+
+Verifies:
+- Text and thinking deltas are yielded in arrival order
+- The final item is the assembled ChatResponse
+- Streaming is used even when use_streaming=False
+- API errors propagate out of the iterator as kernel errors
+"""
+
+import asyncio
+from typing import cast
+from unittest.mock import MagicMock
+
+import pytest
+from amplifier_core import ModuleCoordinator, TextContent, ThinkingContent
+from amplifier_core.llm_errors import LLMError as KernelLLMError
+from amplifier_core.message_models import ChatRequest, ChatResponse, Message
+from amplifier_module_provider_anthropic import AnthropicProvider
+from anthropic.types import (
+    RawContentBlockDeltaEvent,
+    TextDelta,
+    ThinkingDelta,
+)
+
+from tests._helpers import DummyResponse, FakeCoordinator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_provider(config: dict | None = None) -> AnthropicProvider:
+    provider = AnthropicProvider(
+        api_key="test-key",
+        config={"max_retries": 0, **(config or {})},
+    )
+    provider.coordinator = cast(ModuleCoordinator, FakeCoordinator())
+    return provider
+
+
+def _request() -> ChatRequest:
+    return ChatRequest(messages=[Message(role="user", content="Hello")])
+
+
+def _text(index: int, text: str) -> RawContentBlockDeltaEvent:
+    return RawContentBlockDeltaEvent(
+        type="content_block_delta",
+        index=index,
+        delta=TextDelta(type="text_delta", text=text),
+    )
+
+
+def _thinking(index: int, text: str) -> RawContentBlockDeltaEvent:
+    return RawContentBlockDeltaEvent(
+        type="content_block_delta",
+        index=index,
+        delta=ThinkingDelta(type="thinking_delta", thinking=text),
+    )
+
+
+class _FakeStream:
+    def __init__(self, events, final, error: Exception | None = None) -> None:
+        self._events = events
+        self._final = final
+        self._error = error
+        self.response = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def __aiter__(self):
+        for event in self._events:
+            yield event
+        if self._error is not None:
+            raise self._error
+
+    async def get_final_message(self):
+        return self._final
+
+
+def _install_stream(provider: AnthropicProvider, events, error=None) -> MagicMock:
+    final = DummyResponse(content=[MagicMock(type="text", text="Hello world")])
+    stream = MagicMock(return_value=_FakeStream(events, final, error))
+    provider.client.messages.stream = stream
+    return stream
+
+
+async def _collect(provider: AnthropicProvider) -> list:
+    return [item async for item in provider.stream_complete(_request())]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestStreamComplete:
+    def test_yields_deltas_then_final_response(self):
+        provider = _make_provider()
+        _install_stream(
+            provider,
+            [_thinking(0, "hmm"), _text(1, "Hello"), _text(1, " world")],
+        )
+
+        items = asyncio.run(_collect(provider))
+
+        assert isinstance(items[0], ThinkingContent)
+        assert items[0].text == "hmm"
+        assert [i.text for i in items[1:3]] == ["Hello", " world"]
+        assert all(isinstance(i, TextContent) for i in items[1:3])
+        assert isinstance(items[-1], ChatResponse)
+        assert len(items) == 4
+
+    def test_streams_even_when_streaming_disabled(self):
+        provider = _make_provider({"use_streaming": False})
+        stream = _install_stream(provider, [_text(0, "Hi")])
+
+        items = asyncio.run(_collect(provider))
+
+        stream.assert_called_once()
+        assert items[0].text == "Hi"
+        assert isinstance(items[-1], ChatResponse)
+
+    def test_error_propagates_after_partial_output(self):
+        provider = _make_provider()
+        _install_stream(provider, [_text(0, "Hel")], error=RuntimeError("dropped"))
+
+        async def run():
+            seen = []
+            with pytest.raises(KernelLLMError):
+                async for item in provider.stream_complete(_request()):
+                    seen.append(item)
+            return seen
+
+        seen = asyncio.run(run())
+        assert [i.text for i in seen] == ["Hel"]
@@ -0,0 +1,68 @@
+"""Tests for caching of ToolSpec → Anthropic tool conversion.
+
+Verifies:
+- The same tool objects are converted once and reused
+- Callers get fresh dicts, so per-request mutations never leak into the cache
+- Different tool objects (even if equal) are converted independently
+"""
+
+from unittest.mock import patch
+
+from amplifier_core.message_models import ToolSpec
+from amplifier_module_provider_anthropic import AnthropicProvider
+
+
+def _tools() -> list[ToolSpec]:
+    return [
+        ToolSpec(name="grep", description="search", parameters={"type": "object"}),
+        ToolSpec(name="read", description="read", parameters={"type": "object"}),
+    ]
+
+
+class TestToolConversionCache:
+    def test_same_tools_converted_once(self):
+        provider = AnthropicProvider(api_key="test-key")
+        tools = _tools()
+
+        with patch.object(
+            provider,
+            "_build_anthropic_tools",
+            wraps=provider._build_anthropic_tools,
+        ) as build:
+            first = provider._convert_tools_from_request(tools)
+            second = provider._convert_tools_from_request(list(tools))
+
+        assert build.call_count == 1
+        assert first == second
+
+    def test_returned_dicts_are_fresh(self):
+        provider = AnthropicProvider(api_key="test-key")
+        tools = _tools()
+
+        first = provider._convert_tools_from_request(tools)
+        first[-1]["cache_control"] = {"type": "ephemeral"}
+        first[0]["name"] = "Grep"
+        second = provider._convert_tools_from_request(tools)
+
+        assert "cache_control" not in second[-1]
+        assert second[0]["name"] == "grep"
+
+    def test_new_tool_objects_miss(self):
+        provider = AnthropicProvider(api_key="test-key")
+
+        with patch.object(
+            provider,
+            "_build_anthropic_tools",
+            wraps=provider._build_anthropic_tools,
+        ) as build:
+            provider._convert_tools_from_request(_tools())
+            provider._convert_tools_from_request(_tools())
+
+        assert build.call_count == 2
+
+    def test_cache_is_bounded(self):
+        provider = AnthropicProvider(api_key="test-key")
+        for _ in range(20):
+            provider._convert_tools_from_request(_tools())
+
+        assert len(provider._tools_cache) <= 8
@@ -0,0 +1,264 @@
+"""Tests for _validate_anthropic_tool_consistency().
+
+Verifies:
+- Well-formed tool_use/tool_result sequences pass
+- Missing follow-up messages and wrong follow-up roles are rejected
+- Unanswered tool_use and orphaned tool_result blocks are rejected, naming
+  every unmatched ID
+- Matching is set-based, so result order does not matter
+- A tool_use block without an id is rejected (ValueError, not KeyError)
+- Validation never constructs the SDK client
+- Every call checks the whole history, so the shared provider carries no
+  state between unrelated conversations
+- Tool IDs already repaired by complete() may stay unanswered
+- Building request params runs the validator and raises InvalidRequestError
+- complete() reports a locally rejected request as an error llm:response
+"""
+
+import asyncio
+import copy
+import re
+from typing import cast
+
+import pytest
+from amplifier_core import ModuleCoordinator
+from amplifier_core.llm_errors import InvalidRequestError
+from amplifier_core.message_models import ChatRequest, Message, ToolCallBlock
+from amplifier_module_provider_anthropic import AnthropicProvider
+
+from tests._helpers import FakeCoordinator
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+_ERR_ORPHAN_USE = re.compile(r"tool_use blocks but no following message")
+_ERR_WRONG_ROLE = re.compile(r"expected 'user' with tool_results")
+_ERR_NO_RESULT = re.compile(r"without matching tool_result")
+_ERR_NO_USE = re.compile(r"without matching tool_use")
+_ERR_NO_ID = re.compile(r"tool_use block without id")
+
+
+def _tool_use(*ids: str) -> dict:
+    return {
+        "role": "assistant",
+        "content": [
+            {"type": "tool_use", "id": tid, "name": "grep", "input": {}} for tid in ids
+        ],
+    }
+
+
+def _tool_results(*ids: str) -> dict:
+    return {
+        "role": "user",
+        "content": [
+            {"type": "tool_result", "tool_use_id": tid, "content": "ok"} for tid in ids
+        ],
+    }
+
+
+# Shared across tests: the validator only reads its input.
+MESSAGES_WITHOUT_TOOLS = [
+    {"role": "user", "content": "Hi"},
+    {"role": "assistant", "content": "Hello"},
+]
+MESSAGES_MATCHED_PAIRS = [
+    {"role": "user", "content": "Search"},
+    _tool_use("a", "b"),
+    _tool_results("a", "b"),
+    {"role": "assistant", "content": "Done"},
+]
+MESSAGES_RESULTS_REORDERED = [_tool_use("a", "b", "c"), _tool_results("c", "a", "b")]
+MESSAGES_ORPHAN_TOOL_USE = [{"role": "user", "content": "Search"}, _tool_use("a")]
+MESSAGES_NON_USER_FOLLOW_UP = [
+    _tool_use("a"),
+    {"role": "assistant", "content": "Oops"},
+]
+MESSAGES_MISSING_TOOL_RESULT = [_tool_use("a", "b"), _tool_results("a")]
+MESSAGES_ORPHAN_TOOL_RESULT = [_tool_use("a"), _tool_results("a", "z")]
+MESSAGES_TOOL_USE_WITHOUT_ID = [
+    {
+        "role": "assistant",
+        "content": [{"type": "tool_use", "name": "grep", "input": {}}],
+    },
+    _tool_results("a"),
+]
+MESSAGES_RESULT_FOR_EARLIER_TURN = [
+    _tool_use("a"),
+    _tool_results("a"),
+    {"role": "assistant", "content": "Done"},
+    _tool_results("a"),
+]
+
+VALIDATION_CASES = [
+    pytest.param(MESSAGES_WITHOUT_TOOLS, None, id="conversation_without_tools"),
+    pytest.param(MESSAGES_MATCHED_PAIRS, None, id="matched_pairs"),
+    pytest.param(MESSAGES_RESULTS_REORDERED, None, id="result_order_ignored"),
+    pytest.param(MESSAGES_ORPHAN_TOOL_USE, _ERR_ORPHAN_USE, id="trailing_tool_use"),
+    pytest.param(MESSAGES_NON_USER_FOLLOW_UP, _ERR_WRONG_ROLE, id="non_user_follow_up"),
+    pytest.param(
+        MESSAGES_MISSING_TOOL_RESULT, _ERR_NO_RESULT, id="missing_tool_result"
+    ),
+    pytest.param(MESSAGES_ORPHAN_TOOL_RESULT, _ERR_NO_USE, id="orphaned_tool_result"),
+    pytest.param(
+        MESSAGES_RESULT_FOR_EARLIER_TURN, _ERR_NO_USE, id="result_for_earlier_turn"
+    ),
+    pytest.param(MESSAGES_TOOL_USE_WITHOUT_ID, _ERR_NO_ID, id="tool_use_without_id"),
+]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def provider() -> AnthropicProvider:
+    return AnthropicProvider(api_key="test-key")
+
+
+class TestToolConsistencyValidation:
+    @pytest.mark.parametrize(("messages", "expected_error"), VALIDATION_CASES)
+    def test_validation(
+        self,
+        provider: AnthropicProvider,
+        messages: list[dict],
+        expected_error: re.Pattern[str] | None,
+    ):
+        if expected_error is None:
+            provider._validate_anthropic_tool_consistency(messages)
+        else:
+            with pytest.raises(ValueError, match=expected_error):
+                provider._validate_anthropic_tool_consistency(messages)
+
+    def test_validation_does_not_mutate_messages(self, provider):
+        snapshot = copy.deepcopy(MESSAGES_MATCHED_PAIRS)
+
+        provider._validate_anthropic_tool_consistency(MESSAGES_MATCHED_PAIRS)
+
+        assert MESSAGES_MATCHED_PAIRS == snapshot
+
+    def test_validation_does_not_create_client(self):
+        provider = AnthropicProvider(api_key="test-key")
+
+        provider._validate_anthropic_tool_consistency(
+            [_tool_use("a"), _tool_results("a")]
+        )
+
+        assert provider._client is None
+        assert provider._http_pool_lease is None
+
+    def test_validation_error_lists_every_unmatched_id(self, provider):
+        with pytest.raises(ValueError, match=re.escape("['b', 'c']")):
+            provider._validate_anthropic_tool_consistency(
+                [_tool_use("a", "b", "c"), _tool_results("a")]
+            )
+        with pytest.raises(ValueError, match=re.escape("['y', 'z']")):
+            provider._validate_anthropic_tool_consistency(
+                [_tool_use("a"), _tool_results("z", "a", "y")]
+            )
+
+
+class TestWholeHistoryValidation:
+    def test_validation_rechecks_earlier_messages(self, provider):
+        messages = [_tool_use("a"), _tool_results("a")]
+        provider._validate_anthropic_tool_consistency(messages)
+
+        # A prefix that passed before is checked again on the next send.
+        messages[1] = _tool_results("zzz")
+        messages += [_tool_use("b"), _tool_results("b")]
+        with pytest.raises(ValueError, match=_ERR_NO_USE):
+            provider._validate_anthropic_tool_consistency(messages)
+
+    def test_validation_of_unrelated_histories_is_independent(self, provider):
+        provider._validate_anthropic_tool_consistency(
+            [_tool_use("a"), _tool_results("a"), _tool_use("b"), _tool_results("b")]
+        )
+
+        # A longer, unrelated history is not resumed past its first messages.
+        with pytest.raises(ValueError, match=_ERR_NO_RESULT):
+            provider._validate_anthropic_tool_consistency(
+                [
+                    _tool_use("x", "y"),
+                    _tool_results("x"),
+                    _tool_use("b"),
+                    _tool_results("b"),
+                    {"role": "assistant", "content": "Done"},
+                ]
+            )
+
+
+class TestRepairedToolIds:
+    def test_repaired_tool_use_may_stay_unanswered(self):
+        provider = AnthropicProvider(api_key="test-key")
+        provider._repaired_tool_ids.add("a")
+
+        provider._validate_anthropic_tool_consistency(
+            [_tool_use("a"), {"role": "user", "content": "No result"}]
+        )
+        provider._validate_anthropic_tool_consistency([_tool_use("a")])
+
+    def test_unrepaired_sibling_is_still_reported(self):
+        provider = AnthropicProvider(api_key="test-key")
+        provider._repaired_tool_ids.add("a")
+
+        with pytest.raises(ValueError, match=re.escape("['b']")):
+            provider._validate_anthropic_tool_consistency(
+                [_tool_use("a", "b"), {"role": "user", "content": "No results"}]
+            )
+
+
+class TestBuildRequestParamsValidation:
+    def _request(self) -> ChatRequest:
+        return ChatRequest(
+            messages=[
+                Message(role="user", content="Search"),
+                Message(
+                    role="assistant",
+                    content=[ToolCallBlock(id="call_1", name="grep", input={})],
+                ),
+            ]
+        )
+
+    def test_unpaired_tool_use_is_rejected_before_sending(self):
+        provider = AnthropicProvider(api_key="test-key")
+
+        with pytest.raises(InvalidRequestError, match=_ERR_ORPHAN_USE):
+            asyncio.run(provider._build_request_params(self._request()))
+
+    def test_repaired_tool_use_is_sent(self):
+        provider = AnthropicProvider(api_key="test-key")
+        provider._repaired_tool_ids.add("call_1")
+
+        built = asyncio.run(provider._build_request_params(self._request()))
+
+        assert built.params["messages"][-1]["role"] == "assistant"
+
+    def test_rejected_request_emits_error_response(self):
+        provider = AnthropicProvider(api_key="test-key")
+        coordinator = FakeCoordinator()
+        provider.coordinator = cast(ModuleCoordinator, coordinator)
+        # A tool ID reused after its result cannot be repaired by complete().
+        request = ChatRequest(
+            messages=[
+                Message(
+                    role="assistant",
+                    content=[ToolCallBlock(id="call_1", name="grep", input={})],
+                ),
+                Message(role="tool", tool_call_id="call_1", content="ok"),
+                Message(
+                    role="assistant",
+                    content=[ToolCallBlock(id="call_1", name="grep", input={})],
+                ),
+            ]
+        )
+
+        with pytest.raises(InvalidRequestError):
+            asyncio.run(provider.complete(request))
+
+        assert coordinator.hooks.emitted_names() == ["llm:response"]
+        payload = coordinator.hooks.payload_for("llm:response")
+        assert payload is not None
+        assert payload["status"] == "error"
+        assert payload["model"] == provider.default_model